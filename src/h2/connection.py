@@ -7,8 +7,11 @@ An implementation of a HTTP/2 connection.
 from __future__ import annotations
 
 import base64
-from enum import Enum, IntEnum
-from typing import TYPE_CHECKING, Any, Callable
+import collections
+import functools
+from enum import IntEnum
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable, NoReturn
 
 from hpack.exceptions import HPACKError, OversizedHeaderListError
 from hpack.hpack import Decoder, Encoder
@@ -17,7 +20,6 @@ from hyperframe.frame import (
     AltSvcFrame,
     ContinuationFrame,
     DataFrame,
-    ExtensionFrame,
     Frame,
     GoAwayFrame,
     HeadersFrame,
@@ -61,24 +63,25 @@ from .exceptions import (
 )
 from .frame_buffer import FrameBuffer
 from .settings import ChangedSetting, SettingCodes, Settings
-from .stream import H2Stream, StreamClosedBy
+from .stream import STREAM_OPEN, H2Stream, StreamClosedBy, StreamState
 from .utilities import SizeLimitDict, guard_increment_window
-from .windows import WindowManager
+from .windows import LARGEST_FLOW_CONTROL_WINDOW, WindowManager
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
 
     from hpack.struct import Header, HeaderWeaklyTyped
+    from hyperframe.frame import ExtensionFrame
 
 
-class ConnectionState(Enum):
+class ConnectionState(IntEnum):
     IDLE = 0
     CLIENT_OPEN = 1
     SERVER_OPEN = 2
     CLOSED = 3
 
 
-class ConnectionInputs(Enum):
+class ConnectionInputs(IntEnum):
     SEND_HEADERS = 0
     SEND_PUSH_PROMISE = 1
     SEND_DATA = 2
@@ -101,11 +104,60 @@ class ConnectionInputs(Enum):
     RECV_ALTERNATIVE_SERVICE = 19  # Added in 2.3.0
 
 
+# Module-level aliases for the connection inputs used on the hot paths, which
+# saves a global and an attribute lookup on every call.
+_SEND_HEADERS = ConnectionInputs.SEND_HEADERS
+_SEND_PUSH_PROMISE = ConnectionInputs.SEND_PUSH_PROMISE
+_SEND_DATA = ConnectionInputs.SEND_DATA
+_SEND_GOAWAY = ConnectionInputs.SEND_GOAWAY
+_SEND_WINDOW_UPDATE = ConnectionInputs.SEND_WINDOW_UPDATE
+_SEND_PING = ConnectionInputs.SEND_PING
+_SEND_SETTINGS = ConnectionInputs.SEND_SETTINGS
+_SEND_RST_STREAM = ConnectionInputs.SEND_RST_STREAM
+_SEND_PRIORITY = ConnectionInputs.SEND_PRIORITY
+_RECV_HEADERS = ConnectionInputs.RECV_HEADERS
+_RECV_PUSH_PROMISE = ConnectionInputs.RECV_PUSH_PROMISE
+_RECV_DATA = ConnectionInputs.RECV_DATA
+_RECV_GOAWAY = ConnectionInputs.RECV_GOAWAY
+_RECV_WINDOW_UPDATE = ConnectionInputs.RECV_WINDOW_UPDATE
+_RECV_PING = ConnectionInputs.RECV_PING
+_RECV_SETTINGS = ConnectionInputs.RECV_SETTINGS
+_RECV_RST_STREAM = ConnectionInputs.RECV_RST_STREAM
+_RECV_PRIORITY = ConnectionInputs.RECV_PRIORITY
+_SEND_ALTERNATIVE_SERVICE = ConnectionInputs.SEND_ALTERNATIVE_SERVICE
+_RECV_ALTERNATIVE_SERVICE = ConnectionInputs.RECV_ALTERNATIVE_SERVICE
+
+
+# The wire form of a SETTINGS ACK never changes, and a PING ACK differs only
+# in its 8 bytes of opaque data, so both are serialized once up front.
+_SETTINGS_ACK_FRAME = SettingsFrame(0, flags=["ACK"]).serialize()
+_PING_ACK_HEADER = PingFrame(0, flags=["ACK"]).serialize()[:9]
+
+
 class AllowedStreamIDs(IntEnum):
     EVEN = 0
     ODD = 1
 
 
+def _transitions_by_state(
+    transitions: dict[tuple[ConnectionState, ConnectionInputs], tuple[None, ConnectionState]],
+) -> dict[
+    ConnectionState,
+    dict[ConnectionInputs, tuple[None, ConnectionState, dict[ConnectionInputs, Any]]],
+]:
+    """
+    Split a transition table keyed on (state, input) into one table per state,
+    keyed only on the input. Each entry also carries the table for its end
+    state, so the state machine can switch tables without looking them up.
+    """
+    by_state: dict[ConnectionState, dict[ConnectionInputs, Any]] = {
+        state: {} for state in ConnectionState
+    }
+    for (state, input_), (func, target_state) in transitions.items():
+        by_state[state][input_] = (func, target_state, by_state[target_state])
+    return by_state
+
+
 class H2ConnectionStateMachine:
     """
     A single HTTP/2 connection state machine.
@@ -116,6 +168,8 @@ class H2ConnectionStateMachine:
     state transitions.
     """
 
+    __slots__ = ("_state", "_state_transitions")
+
     # For the purposes of this state machine we treat HEADERS and their
     # associated CONTINUATION frames as a single jumbo frame. The protocol
     # allows/requires this by preventing other frames from being interleved in
@@ -126,7 +180,7 @@ class H2ConnectionStateMachine:
     # contains all allowed transitions: anything not in this map is invalid
     # and immediately causes a transition to ``closed``.
 
-    _transitions = {
+    _transitions: dict[tuple[ConnectionState, ConnectionInputs], tuple[None, ConnectionState]] = {
         # State: idle
         (ConnectionState.IDLE, ConnectionInputs.SEND_HEADERS):
             (None, ConnectionState.CLIENT_OPEN),
@@ -245,30 +299,50 @@ class H2ConnectionStateMachine:
             (None, ConnectionState.CLOSED),
     }
 
+    # The same transitions split up by state. process_input only ever looks
+    # at the table for the current state, which is kept in _state_transitions.
+    _state_tables = _transitions_by_state(_transitions)
+
     def __init__(self) -> None:
-        self.state = ConnectionState.IDLE
+        self._state = ConnectionState.IDLE
+        self._state_transitions = self._state_tables[self._state]
+
+    @property
+    def state(self) -> ConnectionState:
+        """
+        The current state of the connection, as a ConnectionState.
+        """
+        return self._state
+
+    @state.setter
+    def state(self, value: ConnectionState) -> None:
+        self._state = value
+        self._state_transitions = self._state_tables[self._state]
 
     def process_input(self, input_: ConnectionInputs) -> list[Event]:
         """
         Process a specific input in the state machine.
         """
-        if not isinstance(input_, ConnectionInputs):
+        # Every caller passes one of the enum's members, so this sanity check
+        # is skipped when assertions are disabled with -O.
+        if __debug__ and not isinstance(input_, ConnectionInputs):
             msg = "Input must be an instance of ConnectionInputs"
-            raise ValueError(msg)  # noqa: TRY004
+            raise ValueError(msg)
 
-        try:
-            func, target_state = self._transitions[(self.state, input_)]
-        except KeyError as e:
-            old_state = self.state
+        transition = self._state_transitions.get(input_)
+        if transition is None:
+            old_state = self._state
             self.state = ConnectionState.CLOSED
-            msg = f"Invalid input {input_} in state {old_state}"
-            raise ProtocolError(msg) from e
-        else:
-            self.state = target_state
-            if func is not None:  # pragma: no cover
-                return func()
+            msg = f"Invalid input {input_.name} in state {old_state.name}"
+            raise ProtocolError(msg)
 
-            return []
+        func, target_state, target_transitions = transition
+        self._state = target_state
+        self._state_transitions = target_transitions
+        if func is not None:  # pragma: no cover
+            return func()
+
+        return []
 
 
 class H2Connection:
@@ -300,6 +374,35 @@ class H2Connection:
     :type config: :class:`H2Configuration <h2.config.H2Configuration>`
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_closed_streams",
+        "_data_to_send",
+        "_frame_dispatch_table",
+        "_header_frames",
+        "_inbound_allowed_ids",
+        "_inbound_flow_control_window_manager",
+        "_inbound_parity",
+        "_newly_closed_stream_ids",
+        "_open_stream_counts",
+        "_outbound_allowed_ids",
+        "_outbound_parity",
+        "_process_input",
+        "config",
+        "decoder",
+        "encoder",
+        "highest_inbound_stream_id",
+        "highest_outbound_stream_id",
+        "incoming_buffer",
+        "local_settings",
+        "max_inbound_frame_size",
+        "max_outbound_frame_size",
+        "outbound_flow_control_window",
+        "remote_settings",
+        "state_machine",
+        "streams",
+    )
+
     # The initial maximum outbound frame size. This can be changed by receiving
     # a settings frame.
     DEFAULT_MAX_OUTBOUND_FRAME_SIZE = 65535
@@ -322,6 +425,7 @@ class H2Connection:
 
     def __init__(self, config: H2Configuration | None = None) -> None:
         self.state_machine = H2ConnectionStateMachine()
+        self._process_input = self.state_machine.process_input
         self.streams: dict[int, H2Stream] = {}
         self.highest_inbound_stream_id = 0
         self.highest_outbound_stream_id = 0
@@ -337,6 +441,14 @@ class H2Connection:
         #: .. versionadded:: 2.5.0
         self.config = config or H2Configuration(client_side=True)
 
+        # The stream IDs we may open ourselves: odd for clients, even for
+        # servers, and the opposite for the remote peer. Worked out once here
+        # rather than on every new stream.
+        self._outbound_allowed_ids = AllowedStreamIDs(self.config.client_side)
+        self._inbound_allowed_ids = AllowedStreamIDs(not self.config.client_side)
+        self._outbound_parity = int(self._outbound_allowed_ids)
+        self._inbound_parity = int(self._inbound_allowed_ids)
+
         # Objects that store settings, including defaults.
         #
         # We set the MAX_CONCURRENT_STREAMS value to 100 because its default is
@@ -381,8 +493,11 @@ class H2Connection:
         # until completion.
         self._header_frames: list[Frame] = []
 
-        # Data that needs to be sent.
-        self._data_to_send = bytearray()
+        # Data that needs to be sent, as a queue of serialized frames. These
+        # are only joined together when the user asks for the data, so that
+        # queueing a frame never copies what is already buffered, and partial
+        # reads only ever look at the chunks they consume.
+        self._data_to_send: collections.deque[bytes | memoryview] = collections.deque()
 
         # Keeps track of how streams are closed.
         # Used to ensure that we don't blow up in the face of frames that were
@@ -394,69 +509,96 @@ class H2Connection:
             size_limit=self.MAX_CLOSED_STREAMS,
         )
 
+        # The number of currently open streams, indexed by the parity of their
+        # stream IDs. These are kept up to date by _stream_state_changed, so
+        # that counting open streams doesn't need to walk every stream.
+        self._open_stream_counts = [0, 0]
+
+        # The IDs of streams that have closed but are still in self.streams.
+        # They are moved into self._closed_streams the next time we count
+        # open streams.
+        self._newly_closed_stream_ids: list[int] = []
+
         # The flow control window manager for the connection.
         self._inbound_flow_control_window_manager = WindowManager(
             max_window_size=self.local_settings.initial_window_size,
         )
 
-        # When in doubt use dict-dispatch.
-        self._frame_dispatch_table: dict[type[Frame], Callable] = {  # type: ignore
-            HeadersFrame: self._receive_headers_frame,
-            PushPromiseFrame: self._receive_push_promise_frame,
-            SettingsFrame: self._receive_settings_frame,
-            DataFrame: self._receive_data_frame,
-            WindowUpdateFrame: self._receive_window_update_frame,
-            PingFrame: self._receive_ping_frame,
-            RstStreamFrame: self._receive_rst_stream_frame,
-            PriorityFrame: self._receive_priority_frame,
-            GoAwayFrame: self._receive_goaway_frame,
-            ContinuationFrame: self._receive_naked_continuation,
-            AltSvcFrame: self._receive_alt_svc_frame,
-            ExtensionFrame: self._receive_unknown_frame,
+        # Frame handlers, keyed by the integer frame type. Any frame type we
+        # don't implement is handed to _receive_unknown_frame.
+        self._frame_dispatch_table: dict[
+            int | None, Callable[[Any], tuple[list[Frame], list[Event]]],
+        ] = {
+            HeadersFrame.type: self._receive_headers_frame,
+            PushPromiseFrame.type: self._receive_push_promise_frame,
+            SettingsFrame.type: self._receive_settings_frame,
+            DataFrame.type: self._receive_data_frame,
+            WindowUpdateFrame.type: self._receive_window_update_frame,
+            PingFrame.type: self._receive_ping_frame,
+            RstStreamFrame.type: self._receive_rst_stream_frame,
+            PriorityFrame.type: self._receive_priority_frame,
+            GoAwayFrame.type: self._receive_goaway_frame,
+            ContinuationFrame.type: self._receive_naked_continuation,
+            AltSvcFrame.type: self._receive_alt_svc_frame,
         }
 
-    def _prepare_for_sending(self, frames: list[Frame]) -> None:
+    def _prepare_for_sending(self, frames: Sequence[Frame]) -> None:
         if not frames:
             return
-        self._data_to_send += b"".join(f.serialize() for f in frames)
-        assert all(f.body_len <= self.max_outbound_frame_size for f in frames)
+        self._data_to_send.extend(f.serialize() for f in frames)
+
+    def _prepare_one(self, frame: Frame) -> None:
+        """
+        Serialize a single frame onto the outbound buffer, without boxing it
+        in a list first.
+        """
+        self._data_to_send.append(frame.serialize())
 
     def _open_streams(self, remainder: int) -> int:
         """
         A common method of counting number of open streams. Returns the number
-        of streams that are open *and* that have (stream ID % 2) == remainder.
-        While it iterates, also deletes any closed streams.
+        of streams that are open *and* that have (stream ID & 1) == remainder.
+        Also deletes any streams that have closed since the last count.
         """
-        count = 0
-        to_delete = []
+        closed_stream_ids = self._newly_closed_stream_ids
+        if closed_stream_ids:
+            streams = self.streams
+            closed_streams = self._closed_streams
+            for stream_id in closed_stream_ids:
+                closed_streams[stream_id] = streams.pop(stream_id).closed_by
+            closed_stream_ids.clear()
 
-        for stream_id, stream in self.streams.items():
-            if stream.open and (stream_id % 2 == remainder):
-                count += 1
-            elif stream.closed:
-                to_delete.append(stream_id)
+        return self._open_stream_counts[remainder]
 
-        for stream_id in to_delete:
-            stream = self.streams.pop(stream_id)
-            self._closed_streams[stream_id] = stream.closed_by
+    def _stream_state_changed(self,
+                              stream_id: int,
+                              previous_state: StreamState,
+                              new_state: StreamState) -> None:
+        """
+        Called by the state machine of each of our streams whenever it changes
+        state. Updates the open stream counts and remembers closed streams so
+        they can be cleaned up later.
+        """
+        # The stream state is already a small int, so whether the stream has
+        # opened (+1), closed (-1) or neither (0) is a pair of table lookups.
+        self._open_stream_counts[stream_id & 1] += STREAM_OPEN[new_state] - STREAM_OPEN[previous_state]
 
-        return count
+        if new_state is StreamState.CLOSED:
+            self._newly_closed_stream_ids.append(stream_id)
 
     @property
     def open_outbound_streams(self) -> int:
         """
         The current number of open outbound streams.
         """
-        outbound_numbers = int(self.config.client_side)
-        return self._open_streams(outbound_numbers)
+        return self._open_streams(self._outbound_parity)
 
     @property
     def open_inbound_streams(self) -> int:
         """
         The current number of open inbound streams.
         """
-        inbound_numbers = int(not self.config.client_side)
-        return self._open_streams(inbound_numbers)
+        return self._open_streams(self._inbound_parity)
 
     @property
     def inbound_flow_control_window(self) -> int:
@@ -490,7 +632,7 @@ class H2Connection:
         if stream_id <= highest_stream_id:
             raise StreamIDTooLowError(stream_id, highest_stream_id)
 
-        if (stream_id % 2) != int(allowed_ids):
+        if (stream_id & 1) != allowed_ids:
             msg = "Invalid stream ID for peer."
             raise ProtocolError(msg)
 
@@ -502,6 +644,7 @@ class H2Connection:
         )
         self.config.logger.debug("Stream ID %d created", stream_id)
         s.max_outbound_frame_size = self.max_outbound_frame_size
+        s.state_machine.state_changed_callback = self._stream_state_changed
 
         self.streams[stream_id] = s
         self.config.logger.debug("Current streams: %s", self.streams.keys())
@@ -519,20 +662,16 @@ class H2Connection:
         Must be called for both clients and servers.
         """
         self.config.logger.debug("Initializing connection")
-        self.state_machine.process_input(ConnectionInputs.SEND_SETTINGS)
+        self._process_input(_SEND_SETTINGS)
         if self.config.client_side:
-            preamble = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
-        else:
-            preamble = b""
+            self._data_to_send.append(b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n")
 
-        f = SettingsFrame(0)
-        for setting, value in self.local_settings.items():
-            f.settings[setting] = value
         self.config.logger.debug(
             "Send Settings frame: %s", self.local_settings,
         )
-
-        self._data_to_send += preamble + f.serialize()
+        self._data_to_send.append(
+            _serialize_settings_frame(tuple(self.local_settings.items())),
+        )
 
     def initiate_upgrade_connection(self, settings_header: bytes | None = None) -> bytes | None:
         """
@@ -584,43 +723,32 @@ class H2Connection:
             frame_data = base64.urlsafe_b64encode(frame_data)
         elif settings_header:
             # We have a settings header from the client. This needs to be
-            # applied, but we want to throw away the ACK. We do this by
-            # inserting the data into a Settings frame and then passing it to
-            # the state machine, but ignoring the return value.
+            # applied, but we don't send an ACK for it. We do this by
+            # inserting the data into a Settings frame and then passing it
+            # through the state machine as though it had been received and
+            # acknowledged.
             settings_header = base64.urlsafe_b64decode(settings_header)
             f = SettingsFrame(0)
             f.parse_body(memoryview(settings_header))
-            self._receive_settings_frame(f)
+            self._process_input(_RECV_SETTINGS)
+            self.remote_settings.update(f.settings)
+            self._acknowledge_settings()
 
         # Set up appropriate state. Stream 1 in a half-closed state:
         # half-closed(local) for clients, half-closed(remote) for servers.
         # Additionally, we need to set up the Connection state machine.
         connection_input = (
-            ConnectionInputs.SEND_HEADERS if self.config.client_side
-            else ConnectionInputs.RECV_HEADERS
+            _SEND_HEADERS if self.config.client_side
+            else _RECV_HEADERS
         )
-        self.config.logger.debug("Process input %s", connection_input)
-        self.state_machine.process_input(connection_input)
+        self.config.logger.debug("Process input %s", connection_input.name)
+        self._process_input(connection_input)
 
         # Set up stream 1.
         self._begin_new_stream(stream_id=1, allowed_ids=AllowedStreamIDs.ODD)
         self.streams[1].upgrade(self.config.client_side)
         return frame_data
 
-    def _get_or_create_stream(self, stream_id: int, allowed_ids: AllowedStreamIDs) -> H2Stream:
-        """
-        Gets a stream by its stream ID. Will create one if one does not already
-        exist. Use allowed_ids to circumvent the usual stream ID rules for
-        clients and servers.
-
-        .. versionchanged:: 2.0.0
-           Removed this function from the public API.
-        """
-        try:
-            return self.streams[stream_id]
-        except KeyError:
-            return self._begin_new_stream(stream_id, allowed_ids)
-
     def _get_stream_by_id(self, stream_id: int | None) -> H2Stream:
         """
         Gets a stream by its stream ID. Raises NoSuchStreamError if the stream
@@ -790,17 +918,21 @@ class H2Connection:
             "Send headers on stream ID %d", stream_id,
         )
 
-        # Check we can open the stream.
-        if stream_id not in self.streams:
+        # Check we can open the stream. Streams that already exist (e.g. when
+        # sending a response or trailers) skip the check entirely.
+        stream = self.streams.get(stream_id)
+        if stream is None:
             max_open_streams = self.remote_settings.max_concurrent_streams
-            if (self.open_outbound_streams + 1) > max_open_streams:
-                msg = f"Max outbound streams is {max_open_streams}, {self.open_outbound_streams} open"
+            open_streams = self.open_outbound_streams
+            if (open_streams + 1) > max_open_streams:
+                msg = f"Max outbound streams is {max_open_streams}, {open_streams} open"
                 raise TooManyStreamsError(msg)
 
-        self.state_machine.process_input(ConnectionInputs.SEND_HEADERS)
-        stream = self._get_or_create_stream(
-            stream_id, AllowedStreamIDs(self.config.client_side),
-        )
+        self._process_input(_SEND_HEADERS)
+        if stream is None:
+            stream = self._begin_new_stream(
+                stream_id, self._outbound_allowed_ids,
+            )
 
         frames: list[Frame] = []
         frames.extend(stream.send_headers(
@@ -887,14 +1019,16 @@ class H2Connection:
             "Frame size on stream ID %d is %d", stream_id, frame_size,
         )
 
-        if frame_size > self.local_flow_control_window(stream_id):
-            msg = f"Cannot send {frame_size} bytes, flow control window is {self.local_flow_control_window(stream_id)}"
+        window_size = self.local_flow_control_window(stream_id)
+        if frame_size > window_size:
+            msg = f"Cannot send {frame_size} bytes, flow control window is {window_size}"
             raise FlowControlError(msg)
-        if frame_size > self.max_outbound_frame_size:
-            msg = f"Cannot send frame size {frame_size}, max frame size is {self.max_outbound_frame_size}"
+        max_frame_size = self.max_outbound_frame_size
+        if frame_size > max_frame_size:
+            msg = f"Cannot send frame size {frame_size}, max frame size is {max_frame_size}"
             raise FrameTooLargeError(msg)
 
-        self.state_machine.process_input(ConnectionInputs.SEND_DATA)
+        self._process_input(_SEND_DATA)
         frames = self.streams[stream_id].send_data(
             data, end_stream, pad_length=pad_length,
         )
@@ -920,7 +1054,7 @@ class H2Connection:
         :returns: Nothing
         """
         self.config.logger.debug("End stream ID %d", stream_id)
-        self.state_machine.process_input(ConnectionInputs.SEND_DATA)
+        self._process_input(_SEND_DATA)
         frames = self.streams[stream_id].end_stream()
         self._prepare_for_sending(frames)
 
@@ -946,7 +1080,7 @@ class H2Connection:
             msg = f"Flow control increment must be between 1 and {self.MAX_WINDOW_INCREMENT}"
             raise ValueError(msg)
 
-        self.state_machine.process_input(ConnectionInputs.SEND_WINDOW_UPDATE)
+        self._process_input(_SEND_WINDOW_UPDATE)
 
         if stream_id is not None:
             stream = self.streams[stream_id]
@@ -1003,7 +1137,7 @@ class H2Connection:
             msg = "Remote peer has disabled stream push"
             raise ProtocolError(msg)
 
-        self.state_machine.process_input(ConnectionInputs.SEND_PUSH_PROMISE)
+        self._process_input(_SEND_PUSH_PROMISE)
         stream = self._get_stream_by_id(stream_id)
 
         # We need to prevent users pushing streams in response to streams that
@@ -1011,20 +1145,19 @@ class H2Connection:
         # easiest way to do that is to assert that the stream_id is not even:
         # this shortcut works because only servers can push and the state
         # machine will enforce this.
-        if (stream_id % 2) == 0:
+        if not stream_id & 1:
             msg = "Cannot recursively push streams."
             raise ProtocolError(msg)
 
         new_stream = self._begin_new_stream(
             promised_stream_id, AllowedStreamIDs.EVEN,
         )
-        self.streams[promised_stream_id] = new_stream
 
         frames = stream.push_stream_in_band(
             promised_stream_id, request_headers, self.encoder,
         )
-        new_frames = new_stream.locally_pushed()
-        self._prepare_for_sending(frames + new_frames)
+        self._prepare_for_sending(frames)
+        self._prepare_for_sending(new_stream.locally_pushed())
 
     def ping(self, opaque_data: bytes | str) -> None:
         """
@@ -1040,10 +1173,10 @@ class H2Connection:
             msg = f"Invalid value for ping data: {opaque_data!r}"
             raise ValueError(msg)
 
-        self.state_machine.process_input(ConnectionInputs.SEND_PING)
+        self._process_input(_SEND_PING)
         f = PingFrame(0)
         f.opaque_data = opaque_data
-        self._prepare_for_sending([f])
+        self._prepare_one(f)
 
     def reset_stream(self, stream_id: int, error_code: ErrorCodes | int = 0) -> None:
         """
@@ -1063,7 +1196,7 @@ class H2Connection:
         :returns: Nothing
         """
         self.config.logger.debug("Reset stream ID %d", stream_id)
-        self.state_machine.process_input(ConnectionInputs.SEND_RST_STREAM)
+        self._process_input(_SEND_RST_STREAM)
         stream = self._get_stream_by_id(stream_id)
         frames = stream.reset_stream(error_code)
         self._prepare_for_sending(frames)
@@ -1087,7 +1220,7 @@ class H2Connection:
         :returns: Nothing
         """
         self.config.logger.debug("Close connection")
-        self.state_machine.process_input(ConnectionInputs.SEND_GOAWAY)
+        self._process_input(_SEND_GOAWAY)
 
         # Additional_data must be bytes
         if additional_data is not None:
@@ -1102,7 +1235,7 @@ class H2Connection:
             error_code=error_code,
             additional_data=(additional_data or b""),
         )
-        self._prepare_for_sending([f])
+        self._prepare_one(f)
 
     def update_settings(self, new_settings: dict[SettingCodes | int, int]) -> None:
         """
@@ -1114,11 +1247,11 @@ class H2Connection:
         self.config.logger.debug(
             "Update connection settings to %s", new_settings,
         )
-        self.state_machine.process_input(ConnectionInputs.SEND_SETTINGS)
+        self._process_input(_SEND_SETTINGS)
         self.local_settings.update(new_settings)
         s = SettingsFrame(0)
         s.settings = new_settings
-        self._prepare_for_sending([s])
+        self._prepare_one(s)
 
     def advertise_alternative_service(self,
                                       field_value: bytes | str,
@@ -1185,9 +1318,7 @@ class H2Connection:
             msg = "Must not provide both origin and stream_id"
             raise ValueError(msg)
 
-        self.state_machine.process_input(
-            ConnectionInputs.SEND_ALTERNATIVE_SERVICE,
-        )
+        self._process_input(_SEND_ALTERNATIVE_SERVICE)
 
         if origin is not None:
             # This ALTSVC is sent on stream zero.
@@ -1272,14 +1403,12 @@ class H2Connection:
             msg = "Servers SHOULD NOT prioritize streams."
             raise RFC1122Error(msg)
 
-        self.state_machine.process_input(
-            ConnectionInputs.SEND_PRIORITY,
-        )
+        self._process_input(_SEND_PRIORITY)
 
         frame = PriorityFrame(stream_id)
         frame_prio = _add_frame_priority(frame, weight, depends_on, exclusive)
 
-        self._prepare_for_sending([frame_prio])
+        self._prepare_one(frame_prio)
 
     def local_flow_control_window(self, stream_id: int) -> int:
         """
@@ -1403,13 +1532,26 @@ class H2Connection:
         :returns: A bytestring containing the data to send on the wire.
         :rtype: ``bytes``
         """
+        chunks = self._data_to_send
         if amount is None:
-            data = bytes(self._data_to_send)
-            self._data_to_send = bytearray()
+            data = b"".join(chunks)
+            chunks.clear()
             return data
-        data = bytes(self._data_to_send[:amount])
-        self._data_to_send = self._data_to_send[amount:]
-        return data
+
+        # Only touch as many chunks as we need to. If the last one is only
+        # partly consumed, keep a view onto the rest of it rather than a copy.
+        taken = []
+        while amount > 0 and chunks:
+            chunk = chunks[0]
+            if len(chunk) <= amount:
+                taken.append(chunks.popleft())
+                amount -= len(chunk)
+            else:
+                view = memoryview(chunk)
+                taken.append(view[:amount])
+                chunks[0] = view[amount:]
+                amount = 0
+        return b"".join(taken)
 
     def clear_outbound_data_buffer(self) -> None:
         """
@@ -1421,11 +1563,12 @@ class H2Connection:
         This method should not normally be used, but is made available to avoid
         exposing implementation details.
         """
-        self._data_to_send = bytearray()
+        self._data_to_send.clear()
 
-    def _acknowledge_settings(self) -> list[Frame]:
+    def _acknowledge_settings(self) -> None:
         """
-        Acknowledge settings that have been received.
+        Acknowledge settings that have been received. The SETTINGS ACK frame
+        itself is emitted by the caller.
 
         .. versionchanged:: 2.0.0
            Removed from public API, removed useless ``event`` parameter, made
@@ -1433,16 +1576,35 @@ class H2Connection:
 
         :returns: Nothing
         """
-        self.state_machine.process_input(ConnectionInputs.SEND_SETTINGS)
+        self._process_input(_SEND_SETTINGS)
 
         changes = self.remote_settings.acknowledge()
 
+        # Changes to INITIAL_WINDOW_SIZE and MAX_FRAME_SIZE both need to be
+        # applied to every stream, so work out what they are up front and then
+        # apply both in a single pass over the streams.
+        #
+        # Changing INITIAL_WINDOW_SIZE updates every stream flow control window
+        # by the delta in the settings values. Note that it does not increment
+        # the *connection* flow control window, per section 6.9.2 of RFC 7540.
+        window_delta = None
         if SettingCodes.INITIAL_WINDOW_SIZE in changes:
             setting = changes[SettingCodes.INITIAL_WINDOW_SIZE]
-            self._flow_control_change_from_settings(
-                setting.original_value,
-                setting.new_value,
-            )
+            window_delta = setting.new_value - (setting.original_value or 0)
+
+        max_frame_size = None
+        if SettingCodes.MAX_FRAME_SIZE in changes:
+            max_frame_size = changes[SettingCodes.MAX_FRAME_SIZE].new_value
+
+        if window_delta is not None or max_frame_size is not None:
+            for stream in self.streams.values():
+                if window_delta is not None:
+                    stream.outbound_flow_control_window = guard_increment_window(
+                        stream.outbound_flow_control_window,
+                        window_delta,
+                    )
+                if max_frame_size is not None:
+                    stream.max_outbound_frame_size = max_frame_size
 
         # HEADER_TABLE_SIZE changes by the remote part affect our encoder: cf.
         # RFC 7540 Section 6.5.2.
@@ -1450,33 +1612,8 @@ class H2Connection:
             setting = changes[SettingCodes.HEADER_TABLE_SIZE]
             self.encoder.header_table_size = setting.new_value
 
-        if SettingCodes.MAX_FRAME_SIZE in changes:
-            setting = changes[SettingCodes.MAX_FRAME_SIZE]
-            self.max_outbound_frame_size = setting.new_value
-            for stream in self.streams.values():
-                stream.max_outbound_frame_size = setting.new_value
-
-        f = SettingsFrame(0)
-        f.flags.add("ACK")
-        return [f]
-
-    def _flow_control_change_from_settings(self, old_value: int | None, new_value: int) -> None:
-        """
-        Update flow control windows in response to a change in the value of
-        SETTINGS_INITIAL_WINDOW_SIZE.
-
-        When this setting is changed, it automatically updates all flow control
-        windows by the delta in the settings values. Note that it does not
-        increment the *connection* flow control window, per section 6.9.2 of
-        RFC 7540.
-        """
-        delta = new_value - (old_value or 0)
-
-        for stream in self.streams.values():
-            stream.outbound_flow_control_window = guard_increment_window(
-                stream.outbound_flow_control_window,
-                delta,
-            )
+        if max_frame_size is not None:
+            self.max_outbound_frame_size = max_frame_size
 
     def _inbound_flow_control_change_from_settings(self, old_value: int | None, new_value: int) -> None:
         """
@@ -1491,12 +1628,16 @@ class H2Connection:
         for stream in self.streams.values():
             stream._inbound_flow_control_change_from_settings(delta)
 
-    def receive_data(self, data: bytes) -> list[Event]:
+    def receive_data(self, data: bytes | bytearray | memoryview) -> list[Event]:
         """
         Pass some received HTTP/2 data to the connection for handling.
 
         :param data: The data received from the remote peer on the network.
-        :type data: ``bytes``
+            Any bytes-like object is accepted, so a ``memoryview`` over a
+            receive buffer can be passed without copying it out first. The
+            connection copies whatever it needs to keep, so the buffer may be
+            reused as soon as this method returns.
+        :type data: ``bytes``, ``bytearray`` or ``memoryview``
         :returns: A list of events that the remote peer triggered by sending
             this data.
         """
@@ -1504,13 +1645,16 @@ class H2Connection:
             "Process received data on connection. Received data: %r", data,
         )
 
-        events: list[Event] = []
         self.incoming_buffer.add_data(data)
         self.incoming_buffer.max_frame_size = self.max_inbound_frame_size
 
         try:
-            for frame in self.incoming_buffer:
-                events.extend(self._receive_frame(frame))
+            # Frames are parsed lazily, one at a time, as we handle them, so
+            # that a malformed frame is only reported once every frame before
+            # it has been processed.
+            events: list[Event] = list(chain.from_iterable(
+                map(self._receive_frame, self.incoming_buffer),
+            ))
         except InvalidPaddingError as e:
             self._terminate_connection(ErrorCodes.PROTOCOL_ERROR)
             msg = "Received frame with invalid padding."
@@ -1533,10 +1677,10 @@ class H2Connection:
            Removed from the public API.
         """
         events: list[Event]
-        self.config.logger.trace("Received frame: %s", repr(frame))
+        self.config.logger.trace("Received frame: %r", frame)
         try:
-            # I don't love using __class__ here, maybe reconsider it.
-            frames, events = self._frame_dispatch_table[frame.__class__](frame)
+            handler = self._frame_dispatch_table.get(frame.type, self._receive_unknown_frame)
+            frames, events = handler(frame)
         except StreamClosedError as e:
             # If the stream was closed by RST_STREAM, we just send a RST_STREAM
             # to the remote peer. Otherwise, this is a connection error, and so
@@ -1544,7 +1688,7 @@ class H2Connection:
             if self._stream_is_closed_by_reset(e.stream_id):
                 f = RstStreamFrame(e.stream_id)
                 f.error_code = e.error_code
-                self._prepare_for_sending([f])
+                self._prepare_one(f)
                 events = e._events
             else:
                 raise
@@ -1560,7 +1704,7 @@ class H2Connection:
                 # Closed by RST_STREAM is a stream error.
                 f = RstStreamFrame(e.stream_id)
                 f.error_code = ErrorCodes.STREAM_CLOSED
-                self._prepare_for_sending([f])
+                self._prepare_one(f)
                 events = []
             elif self._stream_is_closed_by_end(e.stream_id):
                 # Closed by END_STREAM is a connection error.
@@ -1582,19 +1726,23 @@ class H2Connection:
         f = GoAwayFrame(0)
         f.last_stream_id = self.highest_inbound_stream_id
         f.error_code = error_code
-        self.state_machine.process_input(ConnectionInputs.SEND_GOAWAY)
-        self._prepare_for_sending([f])
+        self._process_input(_SEND_GOAWAY)
+        self._prepare_one(f)
 
     def _receive_headers_frame(self, frame: HeadersFrame) -> tuple[list[Frame], list[Event]]:
         """
         Receive a headers frame on the connection.
         """
         # If necessary, check we can open the stream. Also validate that the
-        # stream ID is valid.
-        if frame.stream_id not in self.streams:
+        # stream ID is valid. This happens before the header block is decoded:
+        # refusing the stream is a connection error, so the HPACK state is
+        # about to be discarded anyway and decoding it would be wasted work.
+        stream = self.streams.get(frame.stream_id)
+        if stream is None:
             max_open_streams = self.local_settings.max_concurrent_streams
-            if (self.open_inbound_streams + 1) > max_open_streams:
-                msg = f"Max outbound streams is {max_open_streams}, {self.open_outbound_streams} open"
+            open_streams = self.open_inbound_streams
+            if (open_streams + 1) > max_open_streams:
+                msg = f"Max inbound streams is {max_open_streams}, {open_streams} open"
                 raise TooManyStreamsError(msg)
 
         # Let's decode the headers. We handle headers as bytes internally up
@@ -1602,19 +1750,19 @@ class H2Connection:
         # convert them to unicode.
         headers = _decode_headers(self.decoder, frame.data)
 
-        events = self.state_machine.process_input(
-            ConnectionInputs.RECV_HEADERS,
-        )
-        stream = self._get_or_create_stream(
-            frame.stream_id, AllowedStreamIDs(not self.config.client_side),
-        )
+        events = self._process_input(_RECV_HEADERS)
+        if stream is None:
+            stream = self._begin_new_stream(
+                frame.stream_id, self._inbound_allowed_ids,
+            )
+        flags = frame.flags
         frames, stream_events = stream.receive_headers(
             headers,
-            "END_STREAM" in frame.flags,
+            "END_STREAM" in flags,
             self.config.header_encoding,
         )
 
-        if "PRIORITY" in frame.flags:
+        if "PRIORITY" in flags:
             p_frames, p_events = self._receive_priority_frame(frame)
             expected_frame_types = (RequestReceived, ResponseReceived, TrailersReceived, InformationalResponseReceived)
             assert isinstance(stream_events[0], expected_frame_types)
@@ -1635,9 +1783,7 @@ class H2Connection:
 
         pushed_headers = _decode_headers(self.decoder, frame.data)
 
-        events = self.state_machine.process_input(
-            ConnectionInputs.RECV_PUSH_PROMISE,
-        )
+        events = self._process_input(_RECV_PUSH_PROMISE)
 
         try:
             stream = self._get_stream_by_id(frame.stream_id)
@@ -1665,7 +1811,7 @@ class H2Connection:
         # easiest way to do that is to assert that the stream_id is not even:
         # this shortcut works because only servers can push and the state
         # machine will enforce this.
-        if (frame.stream_id % 2) == 0:
+        if not frame.stream_id & 1:
             msg = "Cannot recursively push streams."
             raise ProtocolError(msg)
 
@@ -1686,7 +1832,6 @@ class H2Connection:
         new_stream = self._begin_new_stream(
             frame.promised_stream_id, AllowedStreamIDs.EVEN,
         )
-        self.streams[frame.promised_stream_id] = new_stream
         new_stream.remotely_pushed(pushed_headers)
 
         return frames, events + stream_events
@@ -1731,9 +1876,7 @@ class H2Connection:
         """
         flow_controlled_length = frame.flow_controlled_length
 
-        events = self.state_machine.process_input(
-            ConnectionInputs.RECV_DATA,
-        )
+        events = self._process_input(_RECV_DATA)
         self._inbound_flow_control_window_manager.window_consumed(
             flow_controlled_length,
         )
@@ -1756,16 +1899,14 @@ class H2Connection:
         """
         Receive a SETTINGS frame on the connection.
         """
-        events = self.state_machine.process_input(
-            ConnectionInputs.RECV_SETTINGS,
-        )
+        events = self._process_input(_RECV_SETTINGS)
 
         # This is an ack of the local settings.
         if "ACK" in frame.flags:
             changed_settings = self._local_settings_acked()
-            ack_event = SettingsAcknowledged()
-            ack_event.changed_settings = changed_settings
-            events.append(ack_event)
+            events.append(
+                SettingsAcknowledged(changed_settings=changed_settings),
+            )
             return [], events
 
         # Add the new settings.
@@ -1775,9 +1916,10 @@ class H2Connection:
                 self.remote_settings, frame.settings,
             ),
         )
-        frames = self._acknowledge_settings()
+        self._acknowledge_settings()
+        self._data_to_send.append(_SETTINGS_ACK_FRAME)
 
-        return frames, events
+        return [], events
 
     def _receive_window_update_frame(self, frame: WindowUpdateFrame) -> tuple[list[Frame], list[Event]]:
         """
@@ -1786,9 +1928,7 @@ class H2Connection:
         # hyperframe will take care of validating the window_increment.
         # If we reach in here, we can assume a valid value.
 
-        events = self.state_machine.process_input(
-            ConnectionInputs.RECV_WINDOW_UPDATE,
-        )
+        events = self._process_input(_RECV_WINDOW_UPDATE)
 
         if frame.stream_id:
             try:
@@ -1799,16 +1939,19 @@ class H2Connection:
             except StreamClosedError:
                 return [], events
         else:
-            # Increment our local flow control window.
-            self.outbound_flow_control_window = guard_increment_window(
-                self.outbound_flow_control_window,
-                frame.window_increment,
-            )
+            # Increment our local flow control window. This is
+            # guard_increment_window, inlined as it runs for every
+            # connection-level WINDOW_UPDATE.
+            new_window_size = self.outbound_flow_control_window + frame.window_increment
+            if new_window_size > LARGEST_FLOW_CONTROL_WINDOW:
+                msg = f"May not increment flow control window past {LARGEST_FLOW_CONTROL_WINDOW}"
+                raise FlowControlError(msg)
+            self.outbound_flow_control_window = new_window_size
 
             # FIXME: Should we split this into one event per active stream?
-            window_updated_event = WindowUpdated()
-            window_updated_event.stream_id = 0
-            window_updated_event.delta = frame.window_increment
+            window_updated_event = WindowUpdated(
+                stream_id=0, delta=frame.window_increment,
+            )
             stream_events = [window_updated_event]
             frames = []
 
@@ -1818,35 +1961,26 @@ class H2Connection:
         """
         Receive a PING frame on the connection.
         """
-        events = self.state_machine.process_input(
-            ConnectionInputs.RECV_PING,
-        )
-        frames: list[Frame] = []
+        events = self._process_input(_RECV_PING)
 
         evt: PingReceived | PingAckReceived
         if "ACK" in frame.flags:
-            evt = PingAckReceived()
+            evt = PingAckReceived(ping_data=frame.opaque_data)
         else:
-            evt = PingReceived()
+            evt = PingReceived(ping_data=frame.opaque_data)
 
             # automatically ACK the PING with the same 'opaque data'
-            f = PingFrame(0)
-            f.flags.add("ACK")
-            f.opaque_data = frame.opaque_data
-            frames.append(f)
+            self._data_to_send.append(_PING_ACK_HEADER + frame.opaque_data)
 
-        evt.ping_data = frame.opaque_data
         events.append(evt)
 
-        return frames, events
+        return [], events
 
     def _receive_rst_stream_frame(self, frame: RstStreamFrame) -> tuple[list[Frame], list[Event]]:
         """
         Receive a RST_STREAM frame on the connection.
         """
-        events = self.state_machine.process_input(
-            ConnectionInputs.RECV_RST_STREAM,
-        )
+        events = self._process_input(_RECV_RST_STREAM)
         try:
             stream = self._get_stream_by_id(frame.stream_id)
         except NoSuchStreamError:
@@ -1862,23 +1996,21 @@ class H2Connection:
         """
         Receive a PRIORITY frame on the connection.
         """
-        events = self.state_machine.process_input(
-            ConnectionInputs.RECV_PRIORITY,
-        )
-
-        event = PriorityUpdated()
-        event.stream_id = frame.stream_id
-        event.depends_on = frame.depends_on
-        event.exclusive = frame.exclusive
-
-        # Weight is an integer between 1 and 256, but the byte only allows
-        # 0 to 255: add one.
-        event.weight = frame.stream_weight + 1
+        events = self._process_input(_RECV_PRIORITY)
 
         # A stream may not depend on itself.
-        if event.depends_on == frame.stream_id:
+        if frame.depends_on == frame.stream_id:
             msg = f"Stream {frame.stream_id} may not depend on itself"
             raise ProtocolError(msg)
+
+        # Weight is an integer between 1 and 256, but the byte only allows
+        # 0 to 255: add one.
+        event = PriorityUpdated(
+            stream_id=frame.stream_id,
+            weight=frame.stream_weight + 1,
+            depends_on=frame.depends_on,
+            exclusive=frame.exclusive,
+        )
         events.append(event)
 
         return [], events
@@ -1887,24 +2019,23 @@ class H2Connection:
         """
         Receive a GOAWAY frame on the connection.
         """
-        events = self.state_machine.process_input(
-            ConnectionInputs.RECV_GOAWAY,
-        )
+        events = self._process_input(_RECV_GOAWAY)
 
         # Clear the outbound data buffer: we cannot send further data now.
         self.clear_outbound_data_buffer()
 
         # Fire an appropriate ConnectionTerminated event.
-        new_event = ConnectionTerminated()
-        new_event.error_code = _error_code_from_int(frame.error_code)
-        new_event.last_stream_id = frame.last_stream_id
-        new_event.additional_data = (frame.additional_data
-                                     if frame.additional_data else None)
+        new_event = ConnectionTerminated(
+            error_code=_error_code_from_int(frame.error_code),
+            last_stream_id=frame.last_stream_id,
+            additional_data=(frame.additional_data
+                             if frame.additional_data else None),
+        )
         events.append(new_event)
 
         return [], events
 
-    def _receive_naked_continuation(self, frame: ContinuationFrame) -> None:
+    def _receive_naked_continuation(self, frame: ContinuationFrame) -> NoReturn:
         """
         A naked CONTINUATION frame has been received. This is always an error,
         but the type of error it is depends on the state of the stream and must
@@ -1913,8 +2044,6 @@ class H2Connection:
         """
         stream = self._get_stream_by_id(frame.stream_id)
         stream.receive_continuation()
-        msg = "Should not be reachable"  # pragma: no cover
-        raise AssertionError(msg)  # pragma: no cover
 
     def _receive_alt_svc_frame(self, frame: AltSvcFrame) -> tuple[list[Frame], list[Event]]:
         """
@@ -1925,9 +2054,7 @@ class H2Connection:
         This frame can optionally be received either on a stream or on stream
         0, and its semantics are different in each case.
         """
-        events = self.state_machine.process_input(
-            ConnectionInputs.RECV_ALTERNATIVE_SERVICE,
-        )
+        events = self._process_input(_RECV_ALTERNATIVE_SERVICE)
         frames = []
 
         if frame.stream_id:
@@ -1954,9 +2081,9 @@ class H2Connection:
             if not self.config.client_side:
                 return frames, events
 
-            event = AlternativeServiceAvailable()
-            event.origin = frame.origin
-            event.field_value = frame.field
+            event = AlternativeServiceAvailable(
+                origin=frame.origin, field_value=frame.field,
+            )
             events.append(event)
 
         return frames, events
@@ -1974,9 +2101,7 @@ class H2Connection:
         self.config.logger.debug(
             "Received unknown extension frame (ID %d)", frame.stream_id,
         )
-        event = UnknownFrameReceived()
-        event.frame = frame
-        return [], [event]
+        return [], [UnknownFrameReceived(frame=frame)]
 
     def _local_settings_acked(self) -> dict[SettingCodes | int, ChangedSetting]:
         """
@@ -2012,7 +2137,7 @@ class H2Connection:
         Returns ``True`` if the stream ID corresponds to an outbound stream
         (one initiated by this peer), returns ``False`` otherwise.
         """
-        return (stream_id % 2 == int(self.config.client_side))
+        return (stream_id & 1) == self._outbound_parity
 
     def _stream_closed_by(self, stream_id: int) -> StreamClosedBy | None:
         """
@@ -2023,11 +2148,10 @@ class H2Connection:
         closed implicitly by the peer opening a stream with a higher stream ID
         before opening this one.
         """
-        if stream_id in self.streams:
-            return self.streams[stream_id].closed_by
-        if stream_id in self._closed_streams:
-            return self._closed_streams[stream_id]
-        return None
+        stream = self.streams.get(stream_id)
+        if stream is not None:
+            return stream.closed_by
+        return self._closed_streams.get(stream_id)
 
     def _stream_is_closed_by_reset(self, stream_id: int) -> bool:
         """
@@ -2049,6 +2173,19 @@ class H2Connection:
         )
 
 
+@functools.lru_cache(maxsize=32)
+def _serialize_settings_frame(settings: tuple[tuple[SettingCodes | int, int], ...]) -> bytes:
+    """
+    Build and serialize a SETTINGS frame carrying the given settings.
+
+    Almost every connection starts by sending one of a handful of identical
+    initial SETTINGS frames, so the serialized frames are cached.
+    """
+    f = SettingsFrame(0)
+    f.settings = dict(settings)
+    return f.serialize()
+
+
 def _add_frame_priority(frame: PriorityFrame | HeadersFrame,
                         weight: int | None = None,
                         depends_on: int | None = None,
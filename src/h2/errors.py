@@ -62,16 +62,18 @@ class ErrorCodes(enum.IntEnum):
     HTTP_1_1_REQUIRED = 0xd
 
 
+_ERROR_CODES_BY_VALUE: dict[int, ErrorCodes] = {
+    code.value: code for code in ErrorCodes
+}
+
+
 def _error_code_from_int(code: int) -> ErrorCodes | int:
     """
     Given an integer error code, returns either one of :class:`ErrorCodes
     <h2.errors.ErrorCodes>` or, if not present in the known set of codes,
     returns the integer directly.
     """
-    try:
-        return ErrorCodes(code)
-    except ValueError:
-        return code
+    return _ERROR_CODES_BY_VALUE.get(code, code)
 
 
 __all__ = ["ErrorCodes"]
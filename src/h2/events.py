@@ -10,16 +10,16 @@ H2 state machine it processes the data and returns a list of Event objects.
 """
 from __future__ import annotations
 
-import binascii
 from typing import TYPE_CHECKING
 
-from .settings import ChangedSetting, SettingCodes, Settings, _setting_code_from_int
+from .settings import ChangedSetting, _setting_code_from_int
 
 if TYPE_CHECKING:  # pragma: no cover
     from hpack import HeaderTuple
     from hyperframe.frame import Frame
 
     from .errors import ErrorCodes
+    from .settings import SettingCodes, Settings
 
 
 class Event:
@@ -27,9 +27,28 @@ class Event:
     Base class for h2 events.
     """
 
+    __slots__ = ()
 
 
-class RequestReceived(Event):
+class _HeadersReceived(Event):
+    """
+    Base class for the events that carry a received header block on a stream.
+
+    This is an internal class, used to share the slots and ``__repr__`` of
+    those events.
+    """
+
+    __slots__ = ("headers", "priority_updated", "stream_id")
+
+    stream_id: int | None
+    headers: list[HeaderTuple] | None
+    priority_updated: PriorityUpdated | None
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} stream_id:{self.stream_id}, headers:{self.headers}>"
+
+
+class RequestReceived(_HeadersReceived):
     """
     The RequestReceived event is fired whenever all of a request's headers
     are received. This event carries the HTTP headers for the given request
@@ -47,32 +66,36 @@ class RequestReceived(Event):
        Added ``stream_ended`` and ``priority_updated`` properties.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("stream_ended",)
+
+    def __init__(self,
+                 *,
+                 stream_id: int | None = None,
+                 headers: list[HeaderTuple] | None = None,
+                 stream_ended: StreamEnded | None = None,
+                 priority_updated: PriorityUpdated | None = None) -> None:
         #: The Stream ID for the stream this request was made on.
-        self.stream_id: int | None = None
+        self.stream_id: int | None = stream_id
 
         #: The request headers.
-        self.headers: list[HeaderTuple] | None = None
+        self.headers: list[HeaderTuple] | None = headers
 
         #: If this request also ended the stream, the associated
         #: :class:`StreamEnded <h2.events.StreamEnded>` event will be available
         #: here.
         #:
         #: .. versionadded:: 2.4.0
-        self.stream_ended: StreamEnded | None = None
+        self.stream_ended: StreamEnded | None = stream_ended
 
         #: If this request also had associated priority information, the
         #: associated :class:`PriorityUpdated <h2.events.PriorityUpdated>`
         #: event will be available here.
         #:
         #: .. versionadded:: 2.4.0
-        self.priority_updated: PriorityUpdated | None = None
-
-    def __repr__(self) -> str:
-        return f"<RequestReceived stream_id:{self.stream_id}, headers:{self.headers}>"
+        self.priority_updated: PriorityUpdated | None = priority_updated
 
 
-class ResponseReceived(Event):
+class ResponseReceived(_HeadersReceived):
     """
     The ResponseReceived event is fired whenever response headers are received.
     This event carries the HTTP headers for the given response and the stream
@@ -86,32 +109,36 @@ class ResponseReceived(Event):
       Added ``stream_ended`` and ``priority_updated`` properties.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("stream_ended",)
+
+    def __init__(self,
+                 *,
+                 stream_id: int | None = None,
+                 headers: list[HeaderTuple] | None = None,
+                 stream_ended: StreamEnded | None = None,
+                 priority_updated: PriorityUpdated | None = None) -> None:
         #: The Stream ID for the stream this response was made on.
-        self.stream_id: int | None = None
+        self.stream_id: int | None = stream_id
 
         #: The response headers.
-        self.headers: list[HeaderTuple] | None = None
+        self.headers: list[HeaderTuple] | None = headers
 
         #: If this response also ended the stream, the associated
         #: :class:`StreamEnded <h2.events.StreamEnded>` event will be available
         #: here.
         #:
         #: .. versionadded:: 2.4.0
-        self.stream_ended: StreamEnded | None = None
+        self.stream_ended: StreamEnded | None = stream_ended
 
         #: If this response also had associated priority information, the
         #: associated :class:`PriorityUpdated <h2.events.PriorityUpdated>`
         #: event will be available here.
         #:
         #: .. versionadded:: 2.4.0
-        self.priority_updated: PriorityUpdated | None = None
-
-    def __repr__(self) -> str:
-        return f"<ResponseReceived stream_id:{self.stream_id}, headers:{self.headers}>"
+        self.priority_updated: PriorityUpdated | None = priority_updated
 
 
-class TrailersReceived(Event):
+class TrailersReceived(_HeadersReceived):
     """
     The TrailersReceived event is fired whenever trailers are received on a
     stream. Trailers are a set of headers sent after the body of the
@@ -128,28 +155,32 @@ class TrailersReceived(Event):
        Added ``stream_ended`` and ``priority_updated`` properties.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("stream_ended",)
+
+    def __init__(self,
+                 *,
+                 stream_id: int | None = None,
+                 headers: list[HeaderTuple] | None = None,
+                 stream_ended: StreamEnded | None = None,
+                 priority_updated: PriorityUpdated | None = None) -> None:
         #: The Stream ID for the stream on which these trailers were received.
-        self.stream_id: int | None = None
+        self.stream_id: int | None = stream_id
 
         #: The trailers themselves.
-        self.headers: list[HeaderTuple] | None = None
+        self.headers: list[HeaderTuple] | None = headers
 
         #: Trailers always end streams. This property has the associated
         #: :class:`StreamEnded <h2.events.StreamEnded>` in it.
         #:
         #: .. versionadded:: 2.4.0
-        self.stream_ended: StreamEnded | None = None
+        self.stream_ended: StreamEnded | None = stream_ended
 
         #: If the trailers also set associated priority information, the
         #: associated :class:`PriorityUpdated <h2.events.PriorityUpdated>`
         #: event will be available here.
         #:
         #: .. versionadded:: 2.4.0
-        self.priority_updated: PriorityUpdated | None = None
-
-    def __repr__(self) -> str:
-        return f"<TrailersReceived stream_id:{self.stream_id}, headers:{self.headers}>"
+        self.priority_updated: PriorityUpdated | None = priority_updated
 
 
 class _HeadersSent(Event):
@@ -160,6 +191,7 @@ class _HeadersSent(Event):
     outgoing header blocks.
     """
 
+    __slots__ = ()
 
 
 class _ResponseSent(_HeadersSent):
@@ -171,6 +203,7 @@ class _ResponseSent(_HeadersSent):
     outgoing header blocks.
     """
 
+    __slots__ = ()
 
 
 class _RequestSent(_HeadersSent):
@@ -182,6 +215,7 @@ class _RequestSent(_HeadersSent):
     outgoing header blocks.
     """
 
+    __slots__ = ()
 
 
 class _TrailersSent(_HeadersSent):
@@ -195,6 +229,7 @@ class _TrailersSent(_HeadersSent):
     outgoing header blocks.
     """
 
+    __slots__ = ()
 
 
 class _PushedRequestSent(_HeadersSent):
@@ -206,9 +241,10 @@ class _PushedRequestSent(_HeadersSent):
     header blocks.
     """
 
+    __slots__ = ()
 
 
-class InformationalResponseReceived(Event):
+class InformationalResponseReceived(_HeadersReceived):
     """
     The InformationalResponseReceived event is fired when an informational
     response (that is, one whose status code is a 1XX code) is received from
@@ -231,23 +267,26 @@ class InformationalResponseReceived(Event):
        Added ``priority_updated`` property.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ()
+
+    def __init__(self,
+                 *,
+                 stream_id: int | None = None,
+                 headers: list[HeaderTuple] | None = None,
+                 priority_updated: PriorityUpdated | None = None) -> None:
         #: The Stream ID for the stream this informational response was made
         #: on.
-        self.stream_id: int | None = None
+        self.stream_id: int | None = stream_id
 
         #: The headers for this informational response.
-        self.headers: list[HeaderTuple] | None = None
+        self.headers: list[HeaderTuple] | None = headers
 
         #: If this response also had associated priority information, the
         #: associated :class:`PriorityUpdated <h2.events.PriorityUpdated>`
         #: event will be available here.
         #:
         #: .. versionadded:: 2.4.0
-        self.priority_updated: PriorityUpdated | None = None
-
-    def __repr__(self) -> str:
-        return f"<InformationalResponseReceived stream_id:{self.stream_id}, headers:{self.headers}>"
+        self.priority_updated: PriorityUpdated | None = priority_updated
 
 
 class DataReceived(Event):
@@ -260,35 +299,39 @@ class DataReceived(Event):
        Added ``stream_ended`` property.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("data", "flow_controlled_length", "stream_ended", "stream_id")
+
+    def __init__(self,
+                 *,
+                 stream_id: int | None = None,
+                 data: bytes | None = None,
+                 flow_controlled_length: int | None = None,
+                 stream_ended: StreamEnded | None = None) -> None:
         #: The Stream ID for the stream this data was received on.
-        self.stream_id: int | None = None
+        self.stream_id: int | None = stream_id
 
         #: The data itself.
-        self.data: bytes | None = None
+        self.data: bytes | None = data
 
         #: The amount of data received that counts against the flow control
         #: window. Note that padding counts against the flow control window, so
         #: when adjusting flow control you should always use this field rather
         #: than ``len(data)``.
-        self.flow_controlled_length: int | None = None
+        self.flow_controlled_length: int | None = flow_controlled_length
 
         #: If this data chunk also completed the stream, the associated
         #: :class:`StreamEnded <h2.events.StreamEnded>` event will be available
         #: here.
         #:
         #: .. versionadded:: 2.4.0
-        self.stream_ended: StreamEnded | None = None
+        self.stream_ended: StreamEnded | None = stream_ended
 
     def __repr__(self) -> str:
+        data = _bytes_representation(self.data, 20) if self.data else ""
         return (
-            "<DataReceived stream_id:{}, "
-            "flow_controlled_length:{}, "
-            "data:{}>".format(
-                self.stream_id,
-                self.flow_controlled_length,
-                _bytes_representation(self.data[:20]) if self.data else "",
-            )
+            f"<DataReceived stream_id:{self.stream_id}, "
+            f"flow_controlled_length:{self.flow_controlled_length}, "
+            f"data:{data}>"
         )
 
 
@@ -301,13 +344,18 @@ class WindowUpdated(Event):
     the connection), and the delta in the window size.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("delta", "stream_id")
+
+    def __init__(self,
+                 *,
+                 stream_id: int | None = None,
+                 delta: int | None = None) -> None:
         #: The Stream ID of the stream whose flow control window was changed.
         #: May be ``0`` if the connection window was changed.
-        self.stream_id: int | None = None
+        self.stream_id: int | None = stream_id
 
         #: The window delta.
-        self.delta: int | None = None
+        self.delta: int | None = delta
 
     def __repr__(self) -> str:
         return f"<WindowUpdated stream_id:{self.stream_id}, delta:{self.delta}>"
@@ -334,37 +382,52 @@ class RemoteSettingsChanged(Event):
        them.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("changed_settings",)
+
+    def __init__(self, *, changed_settings: dict[int, ChangedSetting] | None = None) -> None:
         #: A dictionary of setting byte to
         #: :class:`ChangedSetting <h2.settings.ChangedSetting>`, representing
         #: the changed settings.
-        self.changed_settings: dict[int, ChangedSetting] = {}
+        self.changed_settings: dict[int, ChangedSetting] = (
+            {} if changed_settings is None else changed_settings
+        )
 
     @classmethod
     def from_settings(cls,
                       old_settings: Settings | dict[int, int],
-                      new_settings: dict[int, int]) -> RemoteSettingsChanged:
+                      new_settings: dict[int, int],
+                      *,
+                      include_unchanged: bool = True) -> RemoteSettingsChanged:
         """
         Build a RemoteSettingsChanged event from a set of changed settings.
 
+        .. versionchanged:: 4.3.0
+           Added the ``include_unchanged`` parameter.
+
         :param old_settings: A complete collection of old settings, in the form
                              of a dictionary of ``{setting: value}``.
         :param new_settings: All the changed settings and their new values, in
                              the form of a dictionary of ``{setting: value}``.
+        :param include_unchanged: (optional) Whether to report settings whose
+                                  new value equals their old value. Defaults
+                                  to ``True``.
         """
-        e = cls()
+        get_original_value = old_settings.get
+        changed_settings = {}
         for setting, new_value in new_settings.items():
             s = _setting_code_from_int(setting)
-            original_value = old_settings.get(s)
-            change = ChangedSetting(s, original_value, new_value)
-            e.changed_settings[s] = change
+            original_value = get_original_value(s)
+            if not include_unchanged and original_value == new_value:
+                continue
+            changed_settings[s] = ChangedSetting(
+                s, original_value, new_value,
+            )
 
-        return e
+        return cls(changed_settings=changed_settings)
 
     def __repr__(self) -> str:
-        return "<RemoteSettingsChanged changed_settings:{{{}}}>".format(
-            ", ".join(repr(cs) for cs in self.changed_settings.values()),
-        )
+        s = ", ".join(repr(cs) for cs in self.changed_settings.values())
+        return f"<RemoteSettingsChanged changed_settings:{{{s}}}>"
 
 
 class PingReceived(Event):
@@ -376,9 +439,11 @@ class PingReceived(Event):
     .. versionadded:: 3.1.0
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("ping_data",)
+
+    def __init__(self, *, ping_data: bytes | None = None) -> None:
         #: The data included on the ping.
-        self.ping_data: bytes | None = None
+        self.ping_data: bytes | None = ping_data
 
     def __repr__(self) -> str:
         return f"<PingReceived ping_data:{_bytes_representation(self.ping_data)}>"
@@ -396,9 +461,11 @@ class PingAckReceived(Event):
        Removed deprecated but equivalent ``PingAcknowledged``.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("ping_data",)
+
+    def __init__(self, *, ping_data: bytes | None = None) -> None:
         #: The data included on the ping.
-        self.ping_data: bytes | None = None
+        self.ping_data: bytes | None = ping_data
 
     def __repr__(self) -> str:
         return f"<PingAckReceived ping_data:{_bytes_representation(self.ping_data)}>"
@@ -411,9 +478,11 @@ class StreamEnded(Event):
     locally, but no further data or headers should be expected on that stream.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("stream_id",)
+
+    def __init__(self, *, stream_id: int | None = None) -> None:
         #: The Stream ID of the stream that was closed.
-        self.stream_id: int | None = None
+        self.stream_id: int | None = stream_id
 
     def __repr__(self) -> str:
         return f"<StreamEnded stream_id:{self.stream_id}>"
@@ -430,16 +499,22 @@ class StreamReset(Event):
        This event is now fired when h2 automatically resets a stream.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("error_code", "remote_reset", "stream_id")
+
+    def __init__(self,
+                 *,
+                 stream_id: int | None = None,
+                 error_code: ErrorCodes | None = None,
+                 remote_reset: bool = True) -> None:
         #: The Stream ID of the stream that was reset.
-        self.stream_id: int | None = None
+        self.stream_id: int | None = stream_id
 
         #: The error code given. Either one of :class:`ErrorCodes
         #: <h2.errors.ErrorCodes>` or ``int``
-        self.error_code: ErrorCodes | None = None
+        self.error_code: ErrorCodes | None = error_code
 
         #: Whether the remote peer sent a RST_STREAM or we did.
-        self.remote_reset = True
+        self.remote_reset: bool = remote_reset
 
     def __repr__(self) -> str:
         return f"<StreamReset stream_id:{self.stream_id}, error_code:{self.error_code!s}, remote_reset:{self.remote_reset}>"
@@ -452,15 +527,21 @@ class PushedStreamReceived(Event):
     ID of the parent stream, and the request headers pushed by the remote peer.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("headers", "parent_stream_id", "pushed_stream_id")
+
+    def __init__(self,
+                 *,
+                 pushed_stream_id: int | None = None,
+                 parent_stream_id: int | None = None,
+                 headers: list[HeaderTuple] | None = None) -> None:
         #: The Stream ID of the stream created by the push.
-        self.pushed_stream_id: int | None = None
+        self.pushed_stream_id: int | None = pushed_stream_id
 
         #: The Stream ID of the stream that the push is related to.
-        self.parent_stream_id: int | None = None
+        self.parent_stream_id: int | None = parent_stream_id
 
         #: The request headers, sent by the remote party in the push.
-        self.headers: list[HeaderTuple] | None = None
+        self.headers: list[HeaderTuple] | None = headers
 
     def __repr__(self) -> str:
         return (
@@ -477,11 +558,15 @@ class SettingsAcknowledged(Event):
     :class:`h2.events.RemoteSettingsChanged`.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("changed_settings",)
+
+    def __init__(self, *, changed_settings: dict[SettingCodes | int, ChangedSetting] | None = None) -> None:
         #: A dictionary of setting byte to
         #: :class:`ChangedSetting <h2.settings.ChangedSetting>`, representing
         #: the changed settings.
-        self.changed_settings: dict[SettingCodes | int, ChangedSetting] = {}
+        self.changed_settings: dict[SettingCodes | int, ChangedSetting] = (
+            {} if changed_settings is None else changed_settings
+        )
 
     def __repr__(self) -> str:
         s = ", ".join(repr(cs) for cs in self.changed_settings.values())
@@ -499,21 +584,28 @@ class PriorityUpdated(Event):
     .. versionadded:: 2.0.0
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("depends_on", "exclusive", "stream_id", "weight")
+
+    def __init__(self,
+                 *,
+                 stream_id: int | None = None,
+                 weight: int | None = None,
+                 depends_on: int | None = None,
+                 exclusive: bool | None = None) -> None:
         #: The ID of the stream whose priority information is being updated.
-        self.stream_id: int | None = None
+        self.stream_id: int | None = stream_id
 
         #: The new stream weight. May be the same as the original stream
         #: weight. An integer between 1 and 256.
-        self.weight: int | None = None
+        self.weight: int | None = weight
 
         #: The stream ID this stream now depends on. May be ``0``.
-        self.depends_on: int | None = None
+        self.depends_on: int | None = depends_on
 
         #: Whether the stream *exclusively* depends on the parent stream. If it
         #: does, this stream should inherit the current children of its new
         #: parent.
-        self.exclusive: bool | None = None
+        self.exclusive: bool | None = exclusive
 
     def __repr__(self) -> str:
         return (
@@ -529,30 +621,32 @@ class ConnectionTerminated(Event):
     be taken on the connection: a new connection must be established.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("additional_data", "error_code", "last_stream_id")
+
+    def __init__(self,
+                 *,
+                 error_code: ErrorCodes | int | None = None,
+                 last_stream_id: int | None = None,
+                 additional_data: bytes | None = None) -> None:
         #: The error code cited when tearing down the connection. Should be
         #: one of :class:`ErrorCodes <h2.errors.ErrorCodes>`, but may not be if
         #: unknown HTTP/2 extensions are being used.
-        self.error_code: ErrorCodes | int | None = None
+        self.error_code: ErrorCodes | int | None = error_code
 
         #: The stream ID of the last stream the remote peer saw. This can
         #: provide an indication of what data, if any, never reached the remote
         #: peer and so can safely be resent.
-        self.last_stream_id: int | None = None
+        self.last_stream_id: int | None = last_stream_id
 
         #: Additional debug data that can be appended to GOAWAY frame.
-        self.additional_data: bytes | None = None
+        self.additional_data: bytes | None = additional_data
 
     def __repr__(self) -> str:
+        additional_data = _bytes_representation(self.additional_data or None, 20)
         return (
-            "<ConnectionTerminated error_code:{!s}, last_stream_id:{}, "
-            "additional_data:{}>".format(
-                self.error_code,
-                self.last_stream_id,
-                _bytes_representation(
-                    self.additional_data[:20]
-                    if self.additional_data else None),
-            )
+            f"<ConnectionTerminated error_code:{self.error_code!s}, "
+            f"last_stream_id:{self.last_stream_id}, "
+            f"additional_data:{additional_data}>"
         )
 
 
@@ -577,27 +671,32 @@ class AlternativeServiceAvailable(Event):
     .. versionadded:: 2.3.0
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("field_value", "origin")
+
+    def __init__(self,
+                 *,
+                 origin: bytes | None = None,
+                 field_value: bytes | None = None) -> None:
         #: The origin to which the alternative service field value applies.
         #: This field is either supplied by the server directly, or inferred by
         #: h2 from the ``:authority`` pseudo-header field that was sent
         #: by the user when initiating the stream on which the frame was
         #: received.
-        self.origin: bytes | None = None
+        self.origin: bytes | None = origin
 
         #: The ALTSVC field value. This contains information about the HTTP
         #: alternative service being advertised by the server. h2 does
         #: not parse this field: it is left exactly as sent by the server. The
         #: structure of the data in this field is given by `RFC 7838 Section 3
         #: <https://tools.ietf.org/html/rfc7838#section-3>`_.
-        self.field_value: bytes | None = None
+        self.field_value: bytes | None = field_value
 
     def __repr__(self) -> str:
+        origin = (self.origin or b"").decode("utf-8", "ignore")
+        field_value = (self.field_value or b"").decode("utf-8", "ignore")
         return (
-            "<AlternativeServiceAvailable origin:{}, field_value:{}>".format(
-                (self.origin or b"").decode("utf-8", "ignore"),
-                (self.field_value or b"").decode("utf-8", "ignore"),
-            )
+            f"<AlternativeServiceAvailable origin:{origin}, "
+            f"field_value:{field_value}>"
         )
 
 
@@ -616,24 +715,29 @@ class UnknownFrameReceived(Event):
     .. versionadded:: 2.7.0
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("frame",)
+
+    def __init__(self, *, frame: Frame | None = None) -> None:
         #: The hyperframe Frame object that encapsulates the received frame.
-        self.frame: Frame | None = None
+        self.frame: Frame | None = frame
 
     def __repr__(self) -> str:
         return "<UnknownFrameReceived>"
 
 
-def _bytes_representation(data: bytes | None) -> str | None:
+def _bytes_representation(data: bytes | None, limit: int | None = None) -> str | None:
     """
     Converts a bytestring into something that is safe to print on all Python
-    platforms.
+    platforms. If ``limit`` is given, only that many leading bytes are shown.
 
-    This function is relatively expensive, so it should not be called on the
-    mainline of the code. It's safe to use in things like object repr methods
-    though.
+    This should not be called on the mainline of the code. It's intended for
+    things like object repr methods.
     """
     if data is None:
         return None
 
-    return binascii.hexlify(data).decode("ascii")
+    if limit is not None and len(data) > limit:
+        # Hex the prefix through a view, rather than copying it out first.
+        return memoryview(data)[:limit].hex()
+
+    return data.hex()
@@ -98,6 +98,8 @@ class NoSuchStreamError(ProtocolError):
     """
 
     def __init__(self, stream_id: int) -> None:
+        super().__init__(stream_id)
+
         #: The stream ID corresponds to the non-existent stream.
         self.stream_id = stream_id
 
@@ -110,12 +112,11 @@ class StreamClosedError(NoSuchStreamError):
     stream has been removed.
     """
 
-    def __init__(self, stream_id: int) -> None:
-        #: The stream ID corresponds to the nonexistent stream.
-        self.stream_id = stream_id
+    #: The relevant HTTP/2 error code.
+    error_code = ErrorCodes.STREAM_CLOSED
 
-        #: The relevant HTTP/2 error code.
-        self.error_code = ErrorCodes.STREAM_CLOSED
+    def __init__(self, stream_id: int) -> None:
+        super().__init__(stream_id)
 
         # Any events that internal code may need to fire. Not relevant to
         # external users that may receive a StreamClosedError.
@@ -7,6 +7,8 @@ frames.
 """
 from __future__ import annotations
 
+import struct
+
 from hyperframe.exceptions import InvalidDataError, InvalidFrameError
 from hyperframe.frame import ContinuationFrame, Frame, HeadersFrame, PushPromiseFrame
 
@@ -22,6 +24,15 @@ from .exceptions import FrameDataMissingError, FrameTooLargeError, ProtocolError
 # making it configurable.
 CONTINUATION_BACKLOG = 64
 
+# The connection preface a client sends before its first frame.
+_PREAMBLE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+# Bound once here, rather than looked up on Frame for every frame parsed.
+_parse_frame_header = Frame.parse_frame_header
+
+# The 24-bit length that opens every frame header, read as 16 + 8 bits.
+_FRAME_LENGTH = struct.Struct(">HB")
+
 
 class FrameBuffer:
     """
@@ -30,31 +41,33 @@ class FrameBuffer:
     """
 
     def __init__(self, server: bool = False) -> None:
-        self.data = b""
+        self.data = bytearray()
         self.max_frame_size = 0
-        self._preamble = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n" if server else b""
-        self._preamble_len = len(self._preamble)
+        # The number of preamble bytes still expected. Servers must receive
+        # the whole preamble before any frames.
+        self._preamble_len = len(_PREAMBLE) if server else 0
         self._headers_buffer: list[HeadersFrame | ContinuationFrame | PushPromiseFrame] = []
 
-    def add_data(self, data: bytes) -> None:
+    def add_data(self, data: bytes | bytearray | memoryview) -> None:
         """
         Add more data to the frame buffer.
 
-        :param data: A bytestring containing the byte buffer.
+        :param data: A bytes-like object containing the byte buffer.
         """
         if self._preamble_len:
-            data_len = len(data)
-            of_which_preamble = min(self._preamble_len, data_len)
+            of_which_preamble = min(self._preamble_len, len(data))
+            offset = len(_PREAMBLE) - self._preamble_len
 
-            if self._preamble[:of_which_preamble] != data[:of_which_preamble]:
+            # Compare in place against the constant, rather than slicing out
+            # the part of the preamble that is still expected.
+            if not _PREAMBLE.startswith(data[:of_which_preamble], offset):
                 msg = "Invalid HTTP/2 preamble."
                 raise ProtocolError(msg)
 
             data = data[of_which_preamble:]
             self._preamble_len -= of_which_preamble
-            self._preamble = self._preamble[of_which_preamble:]
 
-        self.data += data
+        self.data.extend(data)
 
     def _validate_frame_length(self, length: int) -> None:
         """
@@ -117,45 +130,57 @@ class FrameBuffer:
         return self
 
     def __next__(self) -> Frame:
-        # First, check that we have enough data to successfully parse the
-        # next frame header. If not, bail. Otherwise, parse it.
-        if len(self.data) < 9:
-            raise StopIteration
-
-        try:
-            f, length = Frame.parse_frame_header(memoryview(self.data[:9]))
-        except (InvalidDataError, InvalidFrameError) as err:  # pragma: no cover
-            msg = f"Received frame with invalid header: {err!s}"
-            raise ProtocolError(msg) from err
-
-        # Next, check that we have enough length to parse the frame body. If
-        # not, bail, leaving the frame header data in the buffer for next time.
-        if len(self.data) < length + 9:
-            raise StopIteration
-
-        # Confirm the frame has an appropriate length.
-        self._validate_frame_length(length)
-
-        # Try to parse the frame body
-        try:
-            f.parse_body(memoryview(self.data[9:9+length]))
-        except InvalidDataError as err:
-            msg = "Received frame with non-compliant data"
-            raise ProtocolError(msg) from err
-        except InvalidFrameError as err:
-            msg = "Frame data missing or invalid"
-            raise FrameDataMissingError(msg) from err
-
-        # At this point, as we know we'll use or discard the entire frame, we
-        # can update the data.
-        self.data = self.data[9+length:]
-
-        # Pass the frame through the header buffer.
-        new_frame = self._update_header_buffer(f)
-
-        # If we got a frame we didn't understand or shouldn't yield, rather
-        # than return None it'd be better if we just tried to get the next
-        # frame in the sequence instead. Recurse back into ourselves to do
-        # that. This is safe because the amount of work we have to do here is
-        # strictly bounded by the length of the buffer.
-        return new_frame if new_frame is not None else self.__next__()
+        while True:
+            # First, check that we have the whole of the next frame. If not,
+            # bail, leaving the data in the buffer for next time. The length
+            # is peeked straight out of the buffer, so that a frame arriving
+            # over many reads isn't parsed afresh on each of them.
+            if len(self.data) < 9:
+                raise StopIteration
+
+            length_high, length_low = _FRAME_LENGTH.unpack_from(self.data)
+            if len(self.data) < (length_high << 8) + length_low + 9:
+                raise StopIteration
+
+            # Parse through a view of the buffer, so that neither the header
+            # nor the body is copied out of it first. The views must be
+            # released before the buffer is resized below, so both are
+            # scoped by with-blocks, which release them even when parsing
+            # fails.
+            with memoryview(self.data) as view:
+                with view[:9] as header:
+                    try:
+                        f, length = _parse_frame_header(header)
+                    except (InvalidDataError, InvalidFrameError) as err:
+                        msg = f"Received frame with invalid header: {err!s}"
+                        raise ProtocolError(msg) from err
+
+                # Confirm the frame has an appropriate length.
+                self._validate_frame_length(length)
+
+                # Try to parse the frame body
+                with view[9:9+length] as body:
+                    try:
+                        f.parse_body(body)
+                    except InvalidDataError as err:
+                        msg = "Received frame with non-compliant data"
+                        raise ProtocolError(msg) from err
+                    except InvalidFrameError as err:
+                        msg = "Frame data missing or invalid"
+                        raise FrameDataMissingError(msg) from err
+
+            # At this point, as we know we'll use or discard the entire frame,
+            # we can drop it from the buffer. Deleting the prefix of a
+            # bytearray in place avoids copying the rest of the buffer into a
+            # new object.
+            del self.data[:9+length]
+
+            # Pass the frame through the header buffer.
+            new_frame = self._update_header_buffer(f)
+
+            # If we got a frame we didn't understand or shouldn't yield, rather
+            # than return None it'd be better if we just tried to get the next
+            # frame in the sequence instead, so go round the loop again. This
+            # terminates because each pass consumes a frame from the buffer.
+            if new_frame is not None:
+                return new_frame
@@ -8,10 +8,9 @@ state of the settings and the unacknowledged future values of the settings.
 """
 from __future__ import annotations
 
-import collections
 import enum
-from collections.abc import Iterator, MutableMapping
-from typing import Union
+from collections.abc import Callable, Iterator, MutableMapping
+from typing import TypeVar, Union, overload
 
 from hyperframe.frame import SettingsFrame
 
@@ -57,16 +56,18 @@ class SettingCodes(enum.IntEnum):
     ENABLE_CONNECT_PROTOCOL = SettingsFrame.ENABLE_CONNECT_PROTOCOL
 
 
+_SETTING_CODES_BY_VALUE: dict[int, SettingCodes] = {
+    code.value: code for code in SettingCodes
+}
+
+
 def _setting_code_from_int(code: int) -> SettingCodes | int:
     """
     Given an integer setting code, returns either one of :class:`SettingCodes
     <h2.settings.SettingCodes>` or, if not present in the known set of codes,
     returns the integer directly.
     """
-    try:
-        return SettingCodes(code)
-    except ValueError:
-        return code
+    return _SETTING_CODES_BY_VALUE.get(code, code)
 
 
 class ChangedSetting:
@@ -90,6 +91,28 @@ class ChangedSetting:
         )
 
 
+_T = TypeVar("_T")
+
+
+def _default_settings(client: bool) -> tuple[tuple[SettingCodes, int], ...]:
+    """
+    The RFC 7540 default values of the settings we track, as pairs of
+    (setting, value).
+    """
+    return (
+        (SettingCodes.HEADER_TABLE_SIZE, 4096),
+        (SettingCodes.ENABLE_PUSH, int(client)),
+        (SettingCodes.INITIAL_WINDOW_SIZE, 65535),
+        (SettingCodes.MAX_FRAME_SIZE, 16384),
+        (SettingCodes.ENABLE_CONNECT_PROTOCOL, 0),
+    )
+
+
+# Built once, so that each new Settings object only has to copy them.
+_CLIENT_DEFAULT_SETTINGS = _default_settings(client=True)
+_SERVER_DEFAULT_SETTINGS = _default_settings(client=False)
+
+
 class Settings(MutableMapping[Union[SettingCodes, int], int]):
     """
     An object that encapsulates HTTP/2 settings state.
@@ -126,19 +149,18 @@ class Settings(MutableMapping[Union[SettingCodes, int], int]):
     :type initial_vales: ``MutableMapping``
     """
 
+    __slots__ = ("_settings",)
+
     def __init__(self, client: bool = True, initial_values: dict[SettingCodes, int] | None = None) -> None:
         # Backing object for the settings. This is a dictionary of
         # (setting: [list of values]), where the first value in the list is the
-        # current value of the setting. Strictly this doesn't use lists but
-        # instead uses collections.deque to avoid repeated memory allocations.
+        # current value of the setting. Only a handful of values are ever
+        # outstanding at once, so plain lists are cheaper here than deques.
         #
         # This contains the default values for HTTP/2.
-        self._settings: dict[SettingCodes | int, collections.deque[int]] = {
-            SettingCodes.HEADER_TABLE_SIZE: collections.deque([4096]),
-            SettingCodes.ENABLE_PUSH: collections.deque([int(client)]),
-            SettingCodes.INITIAL_WINDOW_SIZE: collections.deque([65535]),
-            SettingCodes.MAX_FRAME_SIZE: collections.deque([16384]),
-            SettingCodes.ENABLE_CONNECT_PROTOCOL: collections.deque([0]),
+        defaults = _CLIENT_DEFAULT_SETTINGS if client else _SERVER_DEFAULT_SETTINGS
+        self._settings: dict[SettingCodes | int, list[int]] = {
+            setting: [value] for setting, value in defaults
         }
         if initial_values is not None:
             for key, value in initial_values.items():
@@ -149,7 +171,7 @@ class Settings(MutableMapping[Union[SettingCodes, int], int]):
                         msg,
                         error_code=invalid,
                     )
-                self._settings[key] = collections.deque([value])
+                self._settings[_setting_code_from_int(key)] = [value]
 
     def acknowledge(self) -> dict[SettingCodes | int, ChangedSetting]:
         """
@@ -164,7 +186,7 @@ class Settings(MutableMapping[Union[SettingCodes, int], int]):
         # value outstanding. Update them.
         for k, v in self._settings.items():
             if len(v) > 1:
-                old_setting = v.popleft()
+                old_setting = v.pop(0)
                 new_setting = v[0]
                 changed_settings[k] = ChangedSetting(
                     k, old_setting, new_setting,
@@ -271,6 +293,24 @@ class Settings(MutableMapping[Union[SettingCodes, int], int]):
 
         return val
 
+    @overload  # pragma: no cover
+    def get(self, key: SettingCodes | int) -> int | None: ...
+
+    @overload  # pragma: no cover
+    def get(self, key: SettingCodes | int, default: int | _T) -> int | _T: ...
+
+    def get(self, key: SettingCodes | int, default: object = None) -> object:
+        # Look the value up directly rather than through the Mapping mixin,
+        # which relies on catching the KeyError for unset settings.
+        values = self._settings.get(key)
+        if values is None or values[0] is None:
+            return default
+        return values[0]
+
+    def __contains__(self, key: object) -> bool:
+        values = self._settings.get(key)  # type: ignore[call-overload]
+        return values is not None and values[0] is not None
+
     def __setitem__(self, key: SettingCodes | int, value: int) -> None:
         invalid = _validate_setting(key, value)
         if invalid:
@@ -283,8 +323,11 @@ class Settings(MutableMapping[Union[SettingCodes, int], int]):
         try:
             items = self._settings[key]
         except KeyError:
-            items = collections.deque([None])  # type: ignore
-            self._settings[key] = items
+            # Store well-known settings under their SettingCodes member, even
+            # when the peer sent them as plain integers, so that the keys of
+            # changed_settings are always the canonical objects.
+            items = [None]  # type: ignore
+            self._settings[_setting_code_from_int(key)] = items
 
         items.append(value)
 
@@ -308,24 +351,61 @@ class Settings(MutableMapping[Union[SettingCodes, int], int]):
         return NotImplemented
 
 
-def _validate_setting(setting: SettingCodes | int, value: int) -> ErrorCodes:
+def _validate_flag(value: int) -> ErrorCodes:
     """
-    Confirms that a specific setting has a well-formed value. If the setting is
-    invalid, returns an error code. Otherwise, returns 0 (NO_ERROR).
+    Validates a setting that may only be 0 or 1.
     """
-    if setting == SettingCodes.ENABLE_PUSH:
-        if value not in (0, 1):
-            return ErrorCodes.PROTOCOL_ERROR
-    elif setting == SettingCodes.INITIAL_WINDOW_SIZE:
-        if not 0 <= value <= 2147483647:  # 2^31 - 1
-            return ErrorCodes.FLOW_CONTROL_ERROR
-    elif setting == SettingCodes.MAX_FRAME_SIZE:
-        if not 16384 <= value <= 16777215:  # 2^14 and 2^24 - 1
-            return ErrorCodes.PROTOCOL_ERROR
-    elif setting == SettingCodes.MAX_HEADER_LIST_SIZE:
-        if value < 0:
-            return ErrorCodes.PROTOCOL_ERROR
-    elif setting == SettingCodes.ENABLE_CONNECT_PROTOCOL and value not in (0, 1):
+    if value not in (0, 1):
         return ErrorCodes.PROTOCOL_ERROR
+    return ErrorCodes.NO_ERROR
+
 
+def _validate_initial_window_size(value: int) -> ErrorCodes:
+    """
+    Validates SETTINGS_INITIAL_WINDOW_SIZE.
+    """
+    if not 0 <= value <= 2147483647:  # 2^31 - 1
+        return ErrorCodes.FLOW_CONTROL_ERROR
     return ErrorCodes.NO_ERROR
+
+
+def _validate_max_frame_size(value: int) -> ErrorCodes:
+    """
+    Validates SETTINGS_MAX_FRAME_SIZE.
+    """
+    if not 16384 <= value <= 16777215:  # 2^14 and 2^24 - 1
+        return ErrorCodes.PROTOCOL_ERROR
+    return ErrorCodes.NO_ERROR
+
+
+def _validate_non_negative(value: int) -> ErrorCodes:
+    """
+    Validates a setting that may take any non-negative value.
+    """
+    if value < 0:
+        return ErrorCodes.PROTOCOL_ERROR
+    return ErrorCodes.NO_ERROR
+
+
+# The settings whose values are constrained, mapped to their validators. Any
+# setting not listed here accepts any value.
+_SETTING_VALIDATORS: dict[SettingCodes | int, Callable[[int], ErrorCodes]] = {
+    SettingCodes.HEADER_TABLE_SIZE: _validate_non_negative,
+    SettingCodes.ENABLE_PUSH: _validate_flag,
+    SettingCodes.MAX_CONCURRENT_STREAMS: _validate_non_negative,
+    SettingCodes.INITIAL_WINDOW_SIZE: _validate_initial_window_size,
+    SettingCodes.MAX_FRAME_SIZE: _validate_max_frame_size,
+    SettingCodes.MAX_HEADER_LIST_SIZE: _validate_non_negative,
+    SettingCodes.ENABLE_CONNECT_PROTOCOL: _validate_flag,
+}
+
+
+def _validate_setting(setting: SettingCodes | int, value: int) -> ErrorCodes:
+    """
+    Confirms that a specific setting has a well-formed value. If the setting is
+    invalid, returns an error code. Otherwise, returns 0 (NO_ERROR).
+    """
+    validator = _SETTING_VALIDATORS.get(setting)
+    if validator is None:
+        return ErrorCodes.NO_ERROR
+    return validator(value)
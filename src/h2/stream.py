@@ -7,7 +7,7 @@ An implementation of a HTTP/2 stream.
 from __future__ import annotations
 
 from enum import Enum, IntEnum
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NoReturn
 
 from hpack import HeaderTuple
 from hyperframe.frame import AltSvcFrame, ContinuationFrame, DataFrame, Frame, HeadersFrame, PushPromiseFrame, RstStreamFrame, WindowUpdateFrame
@@ -30,12 +30,11 @@ from .events import (
     _ResponseSent,
     _TrailersSent,
 )
-from .exceptions import FlowControlError, InvalidBodyLengthError, ProtocolError, StreamClosedError
+from .exceptions import InvalidBodyLengthError, ProtocolError, StreamClosedError
 from .utilities import (
     HeaderValidationFlags,
     authority_from_headers,
     extract_method_header,
-    guard_increment_window,
     is_informational_response,
     normalize_inbound_headers,
     normalize_outbound_headers,
@@ -43,10 +42,10 @@ from .utilities import (
     validate_headers,
     validate_outbound_headers,
 )
-from .windows import WindowManager
+from .windows import LARGEST_FLOW_CONTROL_WINDOW, WindowManager
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Generator, Iterable
+    from collections.abc import Callable, Generator, Iterable
 
     from hpack.hpack import Encoder
     from hpack.struct import Header, HeaderWeaklyTyped
@@ -64,7 +63,7 @@ class StreamState(IntEnum):
     CLOSED = 6
 
 
-class StreamInputs(Enum):
+class StreamInputs(IntEnum):
     SEND_HEADERS = 0
     SEND_PUSH_PROMISE = 1
     SEND_RST_STREAM = 2
@@ -115,6 +114,18 @@ class H2StreamStateMachine:
         for logging purposes.
     """
 
+    __slots__ = (
+        "client",
+        "headers_received",
+        "headers_sent",
+        "state",
+        "state_changed_callback",
+        "stream_closed_by",
+        "stream_id",
+        "trailers_received",
+        "trailers_sent",
+    )
+
     def __init__(self, stream_id: int) -> None:
         self.state = StreamState.IDLE
         self.stream_id = stream_id
@@ -131,23 +142,30 @@ class H2StreamStateMachine:
         # How the stream was closed. One of StreamClosedBy.
         self.stream_closed_by: StreamClosedBy | None = None
 
+        # Called with (stream_id, previous_state, new_state) whenever an input
+        # moves the stream to a different state. The connection uses this to
+        # keep track of open and closed streams without iterating over them.
+        self.state_changed_callback: Callable[[int, StreamState, StreamState], None] | None = None
+
     def process_input(self, input_: StreamInputs) -> Any:
         """
         Process a specific input in the state machine.
         """
-        if not isinstance(input_, StreamInputs):
+        # Every caller passes one of the enum's members, so this sanity check
+        # is skipped when assertions are disabled with -O.
+        if __debug__ and not isinstance(input_, StreamInputs):
             msg = "Input must be an instance of StreamInputs"
-            raise ValueError(msg)  # noqa: TRY004
+            raise ValueError(msg)
 
+        previous_state = self.state
         try:
-            func, target_state = _transitions[(self.state, input_)]
-        except KeyError as err:
-            old_state = self.state
-            self.state = StreamState.CLOSED
-            msg = f"Invalid input {input_} in state {old_state}"
-            raise ProtocolError(msg) from err
-        else:
-            previous_state = self.state
+            transition = _transition_table[previous_state * _INPUT_COUNT + input_]
+            if transition is None:
+                self.state = StreamState.CLOSED
+                msg = f"Invalid input {input_.name} in state {previous_state.name}"
+                raise ProtocolError(msg)
+
+            func, target_state = transition
             self.state = target_state
             if func is not None:
                 try:
@@ -160,6 +178,9 @@ class H2StreamStateMachine:
                     raise ProtocolError(err) from err
 
             return []
+        finally:
+            if self.state is not previous_state and self.state_changed_callback is not None:
+                self.state_changed_callback(self.stream_id, previous_state, self.state)
 
     def request_sent(self, previous_state: StreamState) -> list[Event]:
         """
@@ -195,9 +216,7 @@ class H2StreamStateMachine:
 
         self.client = False
         self.headers_received = True
-        event = RequestReceived()
-        event.stream_id = self.stream_id
-        return [event]
+        return [RequestReceived(stream_id=self.stream_id)]
 
     def response_received(self, previous_state: StreamState) -> list[Event]:
         """
@@ -208,13 +227,12 @@ class H2StreamStateMachine:
         if not self.headers_received:
             assert self.client is True
             self.headers_received = True
-            event = ResponseReceived()
+            event = ResponseReceived(stream_id=self.stream_id)
         else:
             assert not self.trailers_received
             self.trailers_received = True
-            event = TrailersReceived()
+            event = TrailersReceived(stream_id=self.stream_id)
 
-        event.stream_id = self.stream_id
         return [event]
 
     def data_received(self, previous_state: StreamState) -> list[Event]:
@@ -224,44 +242,34 @@ class H2StreamStateMachine:
         if not self.headers_received:
             msg = "cannot receive data before headers"
             raise ProtocolError(msg)
-        event = DataReceived()
-        event.stream_id = self.stream_id
-        return [event]
+        return [DataReceived(stream_id=self.stream_id)]
 
     def window_updated(self, previous_state: StreamState) -> list[Event]:
         """
         Fires when a window update frame is received.
         """
-        event = WindowUpdated()
-        event.stream_id = self.stream_id
-        return [event]
+        return [WindowUpdated(stream_id=self.stream_id)]
 
     def stream_half_closed(self, previous_state: StreamState) -> list[Event]:
         """
         Fires when an END_STREAM flag is received in the OPEN state,
         transitioning this stream to a HALF_CLOSED_REMOTE state.
         """
-        event = StreamEnded()
-        event.stream_id = self.stream_id
-        return [event]
+        return [StreamEnded(stream_id=self.stream_id)]
 
     def stream_ended(self, previous_state: StreamState) -> list[Event]:
         """
         Fires when a stream is cleanly ended.
         """
         self.stream_closed_by = StreamClosedBy.RECV_END_STREAM
-        event = StreamEnded()
-        event.stream_id = self.stream_id
-        return [event]
+        return [StreamEnded(stream_id=self.stream_id)]
 
     def stream_reset(self, previous_state: StreamState) -> list[Event]:
         """
         Fired when a stream is forcefully reset.
         """
         self.stream_closed_by = StreamClosedBy.RECV_RST_STREAM
-        event = StreamReset()
-        event.stream_id = self.stream_id
-        return [event]
+        return [StreamReset(stream_id=self.stream_id)]
 
     def send_new_pushed_stream(self, previous_state: StreamState) -> list[Event]:
         """
@@ -311,9 +319,7 @@ class H2StreamStateMachine:
                 msg = "Cannot receive pushed streams as a server"
             raise ProtocolError(msg)
 
-        event = PushedStreamReceived()
-        event.parent_stream_id = self.stream_id
-        return [event]
+        return [PushedStreamReceived(parent_stream_id=self.stream_id)]
 
     def send_end_stream(self, previous_state: StreamState) -> None:
         """
@@ -343,10 +349,11 @@ class H2StreamStateMachine:
 
         error = StreamClosedError(self.stream_id)
 
-        event = StreamReset()
-        event.stream_id = self.stream_id
-        event.error_code = ErrorCodes.STREAM_CLOSED
-        event.remote_reset = False
+        event = StreamReset(
+            stream_id=self.stream_id,
+            error_code=ErrorCodes.STREAM_CLOSED,
+            remote_reset=False,
+        )
         error._events = [event]
         raise error
 
@@ -429,9 +436,7 @@ class H2StreamStateMachine:
             msg = "Informational response after final response"
             raise ProtocolError(msg)
 
-        event = InformationalResponseReceived()
-        event.stream_id = self.stream_id
-        return [event]
+        return [InformationalResponseReceived(stream_id=self.stream_id)]
 
     def recv_alt_svc(self, previous_state: StreamState) -> list[Event]:
         """
@@ -762,6 +767,26 @@ _transitions = {
 }
 
 
+def _flatten_transitions(
+    transitions: dict[tuple[StreamState, StreamInputs], tuple[Any, StreamState]],
+) -> tuple[tuple[Any, StreamState] | None, ...]:
+    """
+    Lay a transition table keyed on (state, input) out as a flat tuple indexed
+    by ``state * _INPUT_COUNT + input``. Invalid transitions are None.
+    """
+    table: list[tuple[Any, StreamState] | None] = [None] * (len(StreamState) * _INPUT_COUNT)
+    for (state, input_), transition in transitions.items():
+        table[state * _INPUT_COUNT + input_] = transition
+    return tuple(table)
+
+
+# Both stream states and inputs are small, dense integers, so process_input
+# finds its transition by indexing into this flat table, rather than hashing a
+# (state, input) tuple for every frame.
+_INPUT_COUNT = len(StreamInputs)
+_transition_table = _flatten_transitions(_transitions)
+
+
 class H2Stream:
     """
     A low-level HTTP/2 stream object. This handles building and receiving
@@ -773,6 +798,20 @@ class H2Stream:
     ``ProtocolError``.
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_actual_content_length",
+        "_authority",
+        "_expected_content_length",
+        "_inbound_window_manager",
+        "config",
+        "max_outbound_frame_size",
+        "outbound_flow_control_window",
+        "request_method",
+        "state_machine",
+        "stream_id",
+    )
+
     def __init__(self,
                  stream_id: int,
                  config: H2Configuration,
@@ -1138,25 +1177,24 @@ class H2Stream:
         # That means we need to catch the error and forcibly close the stream.
         if events:
             events[0].delta = increment
-            try:
-                self.outbound_flow_control_window = guard_increment_window(
-                    self.outbound_flow_control_window,
-                    increment,
-                )
-            except FlowControlError:
+            new_window_size = self.outbound_flow_control_window + increment
+            if new_window_size <= LARGEST_FLOW_CONTROL_WINDOW:
+                self.outbound_flow_control_window = new_window_size
+            else:
                 # Ok, this is bad. We're going to need to perform a local
                 # reset.
-                event = StreamReset()
-                event.stream_id = self.stream_id
-                event.error_code = ErrorCodes.FLOW_CONTROL_ERROR
-                event.remote_reset = False
+                event = StreamReset(
+                    stream_id=self.stream_id,
+                    error_code=ErrorCodes.FLOW_CONTROL_ERROR,
+                    remote_reset=False,
+                )
 
                 events = [event]
-                frames = self.reset_stream(event.error_code)
+                frames = self.reset_stream(ErrorCodes.FLOW_CONTROL_ERROR)
 
         return frames, events
 
-    def receive_continuation(self) -> None:
+    def receive_continuation(self) -> NoReturn:
         """
         A naked CONTINUATION frame has been received. This is always an error,
         but the type of error it is depends on the state of the stream and must
@@ -1299,21 +1337,24 @@ class H2Stream:
 
         # Slice into blocks of max_outbound_frame_size. Be careful with this:
         # it only works right because we never send padded frames or priority
-        # information on the frames. Revisit this if we do.
+        # information on the frames. Revisit this if we do. The blocks are
+        # views of the encoded headers, so that splitting a large header block
+        # doesn't copy it: each block is copied once, when its frame is
+        # serialized.
+        max_size = self.max_outbound_frame_size or 0
+        header_view = memoryview(encoded_headers)
         header_blocks = [
-            encoded_headers[i:i+(self.max_outbound_frame_size or 0)]
-            for i in range(
-                0, len(encoded_headers), (self.max_outbound_frame_size or 0),
-            )
+            header_view[i:i+max_size]
+            for i in range(0, len(header_view), max_size)
         ]
 
         frames: list[HeadersFrame | ContinuationFrame | PushPromiseFrame] = []
-        first_frame.data = header_blocks[0]
+        first_frame.data = header_blocks[0]  # type: ignore[assignment]
         frames.append(first_frame)
 
         for block in header_blocks[1:]:
             cf = ContinuationFrame(self.stream_id)
-            cf.data = block
+            cf.data = block  # type: ignore[assignment]
             frames.append(cf)
 
         frames[-1].flags.add("END_HEADERS")
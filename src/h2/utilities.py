@@ -185,95 +185,129 @@ class HeaderValidationFlags(NamedTuple):
     is_push_promise: bool
 
 
-def validate_headers(headers: Iterable[Header], hdr_validation_flags: HeaderValidationFlags) -> Iterable[Header]:
+def validate_headers(headers: Iterable[Header], hdr_validation_flags: HeaderValidationFlags) -> Generator[Header, None, None]:
     """
     Validates a header sequence against a set of constraints from RFC 7540.
 
     :param headers: The HTTP header set.
     :param hdr_validation_flags: An instance of HeaderValidationFlags.
     """
-    # This validation logic is built on a sequence of generators that are
-    # iterated over to provide the final header list. This reduces some of the
-    # overhead of doing this checking. However, it's worth noting that this
-    # checking remains somewhat expensive, and attempts should be made wherever
-    # possible to reduce the time spent doing them.
+    # All of the checks on received headers are applied in a single pass over
+    # the header block, rather than by a chain of generators, each of which
+    # would add a generator resumption per header. This checking remains somewhat
+    # expensive, and attempts should be made wherever possible to reduce the
+    # time spent doing it.
     #
-    # For example, we avoid tuple unpacking in loops because it represents a
-    # fixed cost that we don't want to spend, instead indexing into the header
-    # tuples.
-    headers = _reject_empty_header_names(
-        headers, hdr_validation_flags,
-    )
-    headers = _reject_uppercase_header_fields(
-        headers, hdr_validation_flags,
-    )
-    headers = _reject_surrounding_whitespace(
-        headers, hdr_validation_flags,
-    )
-    headers = _reject_te(
-        headers, hdr_validation_flags,
-    )
-    headers = _reject_connection_header(
-        headers, hdr_validation_flags,
-    )
-    headers = _reject_pseudo_header_fields(
-        headers, hdr_validation_flags,
-    )
-    headers = _check_host_authority_header(
-        headers, hdr_validation_flags,
+    # The checks are applied to each header in the same order the individual
+    # pipeline stages used to run in, so the error reported for an invalid
+    # header block is unchanged.
+    #
+    # We only expect to see :authority, Host and :path on request header
+    # blocks that aren't trailers, so those checks are skipped on response
+    # headers and on trailer blocks.
+    is_request = not (
+        hdr_validation_flags.is_response_header or
+        hdr_validation_flags.is_trailer
     )
-    return _check_path_header(headers, hdr_validation_flags)
+    seen_pseudo_header_fields: set[bytes] = set()
+    seen_regular_header = False
+    method = None
+    authority_header_val = None
+    host_header_val = None
 
+    for header in headers:
+        name = header[0]
+        value = header[1]
 
+        _reject_invalid_header_field(name, value)
+
+        if name[0] == SIGIL:
+            _reject_invalid_pseudo_header_field(
+                name, seen_pseudo_header_fields, seen_regular_header,
+            )
+            seen_pseudo_header_fields.add(name)
+
+            if name == b":method":
+                method = value
+
+        else:
+            seen_regular_header = True
+
+        if is_request:
+            if name == b":authority":
+                authority_header_val = value
+            elif name == b"host":
+                host_header_val = value
+            elif name == b":path" and not value:
+                msg = "An empty :path header is forbidden"
+                raise ProtocolError(msg)
 
-def _reject_empty_header_names(headers: Iterable[Header],
-                               hdr_validation_flags: HeaderValidationFlags) -> Generator[Header, None, None]:
-    """
-    Raises a ProtocolError if any header names are empty (length 0).
-    While hpack decodes such headers without errors, they are semantically
-    forbidden in HTTP, see RFC 7230, stating that they must be at least one
-    character long.
-    """
-    for header in headers:
-        if len(header[0]) == 0:
-            msg = "Received header name with zero length."
-            raise ProtocolError(msg)
         yield header
 
+    # Check the pseudo-headers we got to confirm they're acceptable.
+    _check_pseudo_header_field_acceptability(
+        seen_pseudo_header_fields, method, hdr_validation_flags,
+    )
+    if is_request:
+        _check_host_authority_values(authority_header_val, host_header_val)
+
 
-def _reject_uppercase_header_fields(headers: Iterable[Header],
-                                    hdr_validation_flags: HeaderValidationFlags) -> Generator[Header, None, None]:
+def _reject_invalid_header_field(name: bytes, value: bytes) -> None:
     """
-    Raises a ProtocolError if any uppercase character is found in a header
-    block.
+    Raises a ProtocolError if a received header field is malformed on its own,
+    without reference to the rest of the header block: an empty or uppercase
+    name, a name or value surrounded by whitespace, a TE header with a value
+    other than "trailers", or a connection-specific header.
     """
-    for header in headers:
-        if UPPER_RE.search(header[0]):
-            msg = f"Received uppercase header name {header[0]!r}."
-            raise ProtocolError(msg)
-        yield header
+    # Empty header names are decoded by hpack without errors, but they are
+    # semantically forbidden in HTTP, see RFC 7230, stating that they must
+    # be at least one character long.
+    if not name:
+        msg = "Received header name with zero length."
+        raise ProtocolError(msg)
+
+    if UPPER_RE.search(name):
+        msg = f"Received uppercase header name {name!r}."
+        raise ProtocolError(msg)
+
+    # For compatibility with RFC 7230 header fields, we need to allow the
+    # field value to be an empty string. This is ludicrous, but
+    # technically allowed.
+    if name[0] in _WHITESPACE or name[-1] in _WHITESPACE:
+        msg = f"Received header name surrounded by whitespace {name!r}"
+        raise ProtocolError(msg)
+    if value and ((value[0] in _WHITESPACE) or
+       (value[-1] in _WHITESPACE)):
+        msg = f"Received header value surrounded by whitespace {value!r}"
+        raise ProtocolError(msg)
+
+    if name == b"te" and value.lower() != b"trailers":
+        msg = f"Invalid value for TE header: {value!r}"
+        raise ProtocolError(msg)
+
+    if name in CONNECTION_HEADERS:
+        msg = f"Connection-specific header field present: {name!r}."
+        raise ProtocolError(msg)
 
 
-def _reject_surrounding_whitespace(headers: Iterable[Header],
-                                   hdr_validation_flags: HeaderValidationFlags) -> Generator[Header, None, None]:
+def _reject_invalid_pseudo_header_field(name: bytes,
+                                        seen_pseudo_header_fields: set[bytes],
+                                        seen_regular_header: bool) -> None:
     """
-    Raises a ProtocolError if any header name or value is surrounded by
-    whitespace characters.
+    Raises a ProtocolError if a received pseudo-header field is a duplicate,
+    follows an ordinary header field, or is not one defined by HTTP/2.
     """
-    # For compatibility with RFC 7230 header fields, we need to allow the field
-    # value to be an empty string. This is ludicrous, but technically allowed.
-    # The field name may not be empty, though, so we can safely assume that it
-    # must have at least one character in it and throw exceptions if it
-    # doesn't.
-    for header in headers:
-        if header[0][0] in _WHITESPACE or header[0][-1] in _WHITESPACE:
-            msg = f"Received header name surrounded by whitespace {header[0]!r}"
-            raise ProtocolError(msg)
-        if header[1] and ((header[1][0] in _WHITESPACE) or
-           (header[1][-1] in _WHITESPACE)):
-            msg = f"Received header value surrounded by whitespace {header[1]!r}"
-            raise ProtocolError(msg)
-        yield header
+    if name in seen_pseudo_header_fields:
+        msg = f"Received duplicate pseudo-header field {name!r}"
+        raise ProtocolError(msg)
+
+    if seen_regular_header:
+        msg = f"Received pseudo-header field out of sequence: {name!r}"
+        raise ProtocolError(msg)
+
+    if name not in _ALLOWED_PSEUDO_HEADER_FIELDS:
+        msg = f"Received custom pseudo-header field {name!r}"
+        raise ProtocolError(msg)
 
 
 def _reject_te(headers: Iterable[Header], hdr_validation_flags: HeaderValidationFlags) -> Generator[Header, None, None]:
@@ -427,6 +461,18 @@ def _validate_host_authority_header(headers: Iterable[Header]) -> Generator[Head
 
         yield header
 
+    _check_host_authority_values(authority_header_val, host_header_val)
+
+
+def _check_host_authority_values(authority_header_val: bytes | str | None,
+                                 host_header_val: bytes | str | None) -> None:
+    """
+    Given the values of the :authority and Host headers seen in a request
+    block (None if the header was absent), check that at least one of them is
+    set and that they match if both are.
+
+    :raises: ``ProtocolError``
+    """
     # If we have not-None values for these variables, then we know we saw
     # the corresponding header.
     authority_present = (authority_header_val is not None)
@@ -447,26 +493,6 @@ def _validate_host_authority_header(headers: Iterable[Header]) -> Generator[Head
         raise ProtocolError(msg)
 
 
-def _check_host_authority_header(headers: Iterable[Header],
-                                 hdr_validation_flags: HeaderValidationFlags) -> Generator[Header, None, None]:
-    """
-    Raises a ProtocolError if a header block arrives that does not contain an
-    :authority or a Host header, or if a header block contains both fields,
-    but their values do not match.
-    """
-    # We only expect to see :authority and Host headers on request header
-    # blocks that aren't trailers, so skip this validation if this is a
-    # response header or we're looking at trailer blocks.
-    skip_validation = (
-        hdr_validation_flags.is_response_header or
-        hdr_validation_flags.is_trailer
-    )
-    if skip_validation:
-        return (h for h in headers)
-
-    return _validate_host_authority_header(headers)
-
-
 def _check_path_header(headers: Iterable[Header],
                        hdr_validation_flags: HeaderValidationFlags) -> Generator[Header, None, None]:
     """
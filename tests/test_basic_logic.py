@@ -608,6 +608,31 @@ class TestBasicClient:
         assert len(c.data_to_send(10)) == 0
         assert len(c.data_to_send()) == 0
 
+    @pytest.mark.parametrize("read_size", [1, 7, 17, 100])
+    def test_partial_reads_return_data_in_order(self, read_size) -> None:
+        """
+        Partial reads that span and split several queued frames return the
+        same bytes, in the same order, as a single full read.
+        """
+        def queue_data(c) -> None:
+            c.initiate_connection()
+            for ping_data in (b"01234567", b"abcdefgh", b"ABCDEFGH"):
+                c.ping(ping_data)
+
+        c = h2.connection.H2Connection()
+        queue_data(c)
+        expected = c.data_to_send()
+
+        c = h2.connection.H2Connection()
+        queue_data(c)
+        chunks = []
+        while chunk := c.data_to_send(read_size):
+            assert len(chunk) <= read_size
+            chunks.append(chunk)
+
+        assert b"".join(chunks) == expected
+        assert c.data_to_send() == b""
+
     def test_we_can_update_settings(self, frame_factory) -> None:
         """
         Updating the settings emits a SETTINGS frame.
@@ -1001,6 +1026,28 @@ class TestBasicServer:
         assert not events
         assert not c.data_to_send()
 
+    @pytest.mark.parametrize("buffer_type", [bytearray, memoryview])
+    def test_receiving_data_in_buffer_objects(self,
+                                              frame_factory,
+                                              buffer_type) -> None:
+        """
+        Received data may be passed as any bytes-like object, including when
+        it straddles the end of the preamble.
+        """
+        c = h2.connection.H2Connection(config=self.server_config)
+        f = frame_factory.build_headers_frame(
+            self.example_request_headers, flags=["END_STREAM"],
+        )
+        data = frame_factory.preamble() + f.serialize()
+
+        events = c.receive_data(buffer_type(data[:30]))
+        events += c.receive_data(buffer_type(data[30:]))
+
+        assert len(events) == 2
+        assert isinstance(events[0], h2.events.RequestReceived)
+        assert events[0].headers == self.example_request_headers
+        assert isinstance(events[1], h2.events.StreamEnded)
+
     def test_initiate_connection_sends_server_preamble(self, frame_factory) -> None:
         """
         For server-side connections, initiate_connection sends a server
@@ -1576,7 +1623,10 @@ class TestBasicServer:
             stream_id=3,
             headers=self.example_request_headers,
         )
-        with pytest.raises(h2.exceptions.TooManyStreamsError):
+        with pytest.raises(
+            h2.exceptions.TooManyStreamsError,
+            match="Max inbound streams is 1, 1 open",
+        ):
             c.receive_data(f.serialize())
 
         expected_frame = frame_factory.build_goaway_frame(
@@ -105,6 +105,61 @@ class TestClosedStreams:
         # The streams dictionary should be empty.
         assert not c.streams
 
+    def test_open_stream_counts_track_stream_state(self, frame_factory) -> None:
+        """
+        The open stream counts follow streams as they open and close, however
+        they are closed.
+        """
+        c = h2.connection.H2Connection(config=self.server_config)
+        c.receive_data(frame_factory.preamble())
+        c.initiate_connection()
+
+        for stream_id in (1, 3, 5, 7):
+            f = frame_factory.build_headers_frame(
+                self.example_request_headers,
+                stream_id=stream_id,
+            )
+            c.receive_data(f.serialize())
+        c.push_stream(1, 2, self.example_request_headers)
+        c.push_stream(1, 4, self.example_request_headers)
+        c.send_headers(2, self.example_response_headers)
+        assert c.open_inbound_streams == 4
+        assert c.open_outbound_streams == 1
+
+        # Close stream 1 normally, reset streams 3 and 4 locally and stream 5
+        # remotely.
+        f = frame_factory.build_data_frame(b"", flags=["END_STREAM"])
+        c.receive_data(f.serialize())
+        c.send_headers(1, self.example_response_headers, end_stream=True)
+        c.reset_stream(3)
+        c.reset_stream(4)
+        f = frame_factory.build_rst_stream_frame(stream_id=5)
+        c.receive_data(f.serialize())
+
+        assert c.open_inbound_streams == 1
+        assert c.open_outbound_streams == 1
+        assert sorted(c.streams) == [2, 7]
+        assert not any(stream.closed for stream in c.streams.values())
+
+    def test_closed_streams_are_remembered_up_to_a_limit(self, frame_factory) -> None:
+        """
+        Only the most recently closed streams are remembered, so a connection
+        that resets lots of streams doesn't grow without bound.
+        """
+        class LimitedConnection(h2.connection.H2Connection):
+            MAX_CLOSED_STREAMS = 2
+
+        c = LimitedConnection()
+        c.initiate_connection()
+
+        for stream_id in (1, 3, 5):
+            c.send_headers(stream_id, self.example_request_headers)
+            c.reset_stream(stream_id)
+
+        assert not c.open_outbound_streams
+        assert not c.streams
+        assert list(c._closed_streams) == [3, 5]
+
     def test_receive_rst_stream_on_closed_stream(self, frame_factory) -> None:
         """
         RST_STREAM frame should be ignored if stream is in a closed state.
@@ -89,6 +89,29 @@ class TestRemoteSettingsChanged:
             assert e.changed_settings[setting].original_value == original_value
             assert e.changed_settings[setting].new_value == new_value
 
+    @given(SETTINGS_STRATEGY, SETTINGS_STRATEGY)
+    def test_can_omit_unchanged_settings(self,
+                                         old_settings_list,
+                                         new_settings_list) -> None:
+        """
+        Settings whose value did not change can be left out of the event.
+        """
+        old_settings_dict = dict(old_settings_list)
+        new_settings_dict = dict(new_settings_list)
+        e = h2.events.RemoteSettingsChanged.from_settings(
+            old_settings=old_settings_dict,
+            new_settings=new_settings_dict,
+            include_unchanged=False,
+        )
+
+        for setting, new_value in new_settings_dict.items():
+            original_value = old_settings_dict.get(setting)
+            if original_value == new_value:
+                assert setting not in e.changed_settings
+            else:
+                assert e.changed_settings[setting].original_value == original_value
+                assert e.changed_settings[setting].new_value == new_value
+
 
 class TestEventReprs:
     """
@@ -388,3 +411,30 @@ def test_all_events_subclass_from_event(event) -> None:
     Every event defined in h2.events subclasses from h2.events.Event.
     """
     assert (event is h2.events.Event) or issubclass(event, h2.events.Event)
+
+
+@pytest.mark.parametrize("event", list(all_events()))
+def test_all_events_use_slots(event) -> None:
+    """
+    Every event declares __slots__, so instances carry no __dict__.
+    """
+    assert not hasattr(event(), "__dict__")
+
+
+@pytest.mark.parametrize(
+    "event",
+    [e for e in all_events() if e is not h2.events._HeadersReceived],
+)
+def test_events_accept_attributes_as_keywords(event) -> None:
+    """
+    Every event attribute can be set by keyword when building the event.
+    """
+    values = {
+        name: object()
+        for cls in event.__mro__
+        for name in getattr(cls, "__slots__", ())
+    }
+    e = event(**values)
+
+    for name, value in values.items():
+        assert getattr(e, name) is value
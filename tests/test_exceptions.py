@@ -3,6 +3,9 @@ Tests that verify logic local to exceptions.
 """
 from __future__ import annotations
 
+import pytest
+
+import h2.errors
 import h2.exceptions
 
 
@@ -11,3 +14,31 @@ class TestExceptions:
         x = h2.exceptions.StreamIDTooLowError(5, 10)
 
         assert str(x) == "StreamIDTooLowError: 5 is lower than 10"
+
+    @pytest.mark.parametrize(
+        "exception",
+        [h2.exceptions.NoSuchStreamError, h2.exceptions.StreamClosedError],
+    )
+    def test_missing_stream_errors_report_the_stream_id(self, exception) -> None:
+        x = exception(5)
+
+        assert x.stream_id == 5
+        assert str(x) == "5"
+        assert repr(x) == f"{exception.__name__}(5)"
+
+
+@pytest.mark.parametrize(("exception", "error_code"), [
+    (h2.exceptions.ProtocolError, h2.errors.ErrorCodes.PROTOCOL_ERROR),
+    (h2.exceptions.FrameTooLargeError, h2.errors.ErrorCodes.FRAME_SIZE_ERROR),
+    (h2.exceptions.FrameDataMissingError, h2.errors.ErrorCodes.FRAME_SIZE_ERROR),
+    (h2.exceptions.TooManyStreamsError, h2.errors.ErrorCodes.PROTOCOL_ERROR),
+    (h2.exceptions.FlowControlError, h2.errors.ErrorCodes.FLOW_CONTROL_ERROR),
+    (h2.exceptions.StreamClosedError, h2.errors.ErrorCodes.STREAM_CLOSED),
+    (h2.exceptions.DenialOfServiceError, h2.errors.ErrorCodes.ENHANCE_YOUR_CALM),
+])
+def test_protocol_errors_declare_error_code_on_the_class(exception, error_code) -> None:
+    """
+    The GOAWAY error code for each kind of ProtocolError is readable from the
+    class itself, so connection error handling needs no isinstance checks.
+    """
+    assert exception.error_code == error_code
@@ -142,6 +142,40 @@ class TestInvalidFrameSequences:
         )
         assert c.data_to_send() == expected_frame.serialize()
 
+    @pytest.mark.parametrize(
+        ("invalid_frame", "exception"),
+        [
+            # A WINDOW_UPDATE frame with a truncated body.
+            (
+                b"\x00\x00\x03\x08\x00\x00\x00\x00\x00\x00\x00\x02",
+                h2.exceptions.FrameDataMissingError,
+            ),
+            # A SETTINGS frame on a non-zero stream, rejected by its header.
+            (
+                b"\x00\x00\x00\x04\x00\x00\x00\x00\x01",
+                h2.exceptions.ProtocolError,
+            ),
+        ],
+    )
+    def test_failed_frame_parse_does_not_pin_buffer(self,
+                                                    frame_factory,
+                                                    invalid_frame,
+                                                    exception) -> None:
+        """
+        Keeping hold of a frame parsing error does not stop more data being
+        added to the connection's buffer.
+        """
+        c = h2.connection.H2Connection(config=self.server_config)
+        c.receive_data(frame_factory.preamble())
+
+        with pytest.raises(exception) as first:
+            c.receive_data(invalid_frame)
+
+        with pytest.raises(exception):
+            c.receive_data(b"\x00")
+
+        assert first.value.__traceback__ is not None
+
     @pytest.mark.parametrize("request_headers", [example_request_headers, example_request_headers_bytes])
     def test_reject_data_on_closed_streams(self, frame_factory, request_headers) -> None:
         """
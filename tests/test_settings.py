@@ -210,6 +210,40 @@ class TestSettings:
         assert changed.original_value is None
         assert changed.new_value == 81
 
+    def test_unacknowledged_new_values_are_absent(self) -> None:
+        """
+        A new value that has not been acknowledged is neither contained nor
+        returned by get.
+        """
+        s = h2.settings.Settings(client=True)
+        s[80] = 81
+
+        assert 80 not in s
+        assert s.get(80) is None
+        assert s.get(80, 0) == 0
+
+        s.acknowledge()
+
+        assert 80 in s
+        assert s.get(80) == 81
+        assert 81 not in s
+
+    def test_integer_keys_are_stored_as_setting_codes(self) -> None:
+        """
+        Well-known settings set with integer keys are reported with their
+        SettingCodes member.
+        """
+        s = h2.settings.Settings(client=True)
+        s[3] = 100
+        changed_settings = s.acknowledge()
+
+        changed = changed_settings[3]
+        assert changed.setting is h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS
+        assert list(changed_settings) == [
+            h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS,
+        ]
+        assert h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS in list(s)
+
     def test_single_values_arent_affected_by_acknowledgement(self) -> None:
         """
         When acknowledged, unchanged settings remain unchanged.
@@ -342,6 +376,44 @@ class TestSettings:
             assert e.value.error_code == h2.errors.ErrorCodes.PROTOCOL_ERROR
             assert s[h2.settings.SettingCodes.MAX_FRAME_SIZE] == 16384
 
+    @given(integers())
+    def test_cannot_set_invalid_values_for_header_table_size(self, val) -> None:
+        """
+        SETTINGS_HEADER_TABLE_SIZE only allows non-negative values.
+        """
+        s = h2.settings.Settings()
+
+        if val >= 0:
+            s.header_table_size = val
+            s.acknowledge()
+            assert s.header_table_size == val
+        else:
+            with pytest.raises(h2.exceptions.InvalidSettingsValueError) as e:
+                s.header_table_size = val
+
+            s.acknowledge()
+            assert e.value.error_code == h2.errors.ErrorCodes.PROTOCOL_ERROR
+            assert s.header_table_size == 4096
+
+    @given(integers())
+    def test_cannot_set_invalid_values_for_max_concurrent_streams(self, val) -> None:
+        """
+        SETTINGS_MAX_CONCURRENT_STREAMS only allows non-negative values.
+        """
+        s = h2.settings.Settings()
+
+        if val >= 0:
+            s.max_concurrent_streams = val
+            s.acknowledge()
+            assert s.max_concurrent_streams == val
+        else:
+            with pytest.raises(h2.exceptions.InvalidSettingsValueError) as e:
+                s.max_concurrent_streams = val
+
+            s.acknowledge()
+            assert e.value.error_code == h2.errors.ErrorCodes.PROTOCOL_ERROR
+            assert s.max_concurrent_streams == 2**32 + 1
+
     @given(integers())
     def test_cannot_set_invalid_values_for_max_header_list_size(self, val) -> None:
         """
@@ -41,6 +41,19 @@ class TestConnectionStateMachine:
         with pytest.raises(ValueError):
             c.process_input(1)
 
+    def test_invalid_transition_names_input_and_state(self) -> None:
+        """
+        The error raised for an invalid transition names both the input and
+        the state it was received in.
+        """
+        c = h2.connection.H2ConnectionStateMachine()
+        c.state = h2.connection.ConnectionState.CLOSED
+
+        with pytest.raises(h2.exceptions.ProtocolError) as e:
+            c.process_input(h2.connection.ConnectionInputs.SEND_HEADERS)
+
+        assert str(e.value) == "Invalid input SEND_HEADERS in state CLOSED"
+
     @pytest.mark.parametrize(
         "state",
         (
@@ -123,11 +123,11 @@ def table_maker(initial_state, final_state, outputs, port):
 
 def enum_member_name(state):
     """
-    All enum member names have the form <EnumClassName>.<EnumMemberName>. For
-    our rendering we only want the member name, so we take their representation
-    and split it.
+    For our rendering we only want the member name, not the qualified
+    <EnumClassName>.<EnumMemberName> form. IntEnum members no longer include
+    the class name in their ``str()`` on newer Pythons, so use ``name``.
     """
-    return str(state).split('.', 1)[1]
+    return state.name
 
 
 def function_name(func):